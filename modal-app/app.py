@@ -19,7 +19,7 @@ app = modal.App("driving-passion")
 # Define the container image with all dependencies and local modules
 image = (
     modal.Image.debian_slim(python_version="3.11")
-    .pip_install("httpx", "fastapi[standard]", "curl_cffi")
+    .pip_install("httpx[http2]", "fastapi[standard]", "curl_cffi", "orjson")
     .add_local_file("constants.py", "/root/constants.py")
     .add_local_file("utils.py", "/root/utils.py")
     .add_local_file("user_agents.py", "/root/user_agents.py")
@@ -30,6 +30,10 @@ image = (
     .add_local_file("pricing_model.py", "/root/pricing_model.py")
 )
 
+# Container-only imports (fastapi is installed in the image, not necessarily locally)
+with image.imports():
+    from fastapi.responses import ORJSONResponse
+
 # =============================================================================
 # SECRETS
 # =============================================================================
@@ -417,7 +421,7 @@ def calculate_import_margin(url: str) -> dict:
     timeout=300,
 )
 @modal.fastapi_endpoint(method="POST", docs=True)
-def analyze(body: dict) -> dict:
+def analyze(body: dict) -> "ORJSONResponse":
     """
     POST /analyze
 
@@ -439,15 +443,17 @@ def analyze(body: dict) -> dict:
     url = body.get("url")
 
     if not url:
-        return {
+        return ORJSONResponse({
             "success": False,
             "error": {
                 "type": "VALIDATION_ERROR",
                 "message": "URL is required",
             },
-        }
+        })
 
-    return calculate_import_margin.remote(url)
+    # The analysis payload (vehicle, comparables, BPM, valuation) is already
+    # JSON-ready, so serialize it directly with orjson
+    return ORJSONResponse(calculate_import_margin.remote(url))
 
 
 @app.function(
@@ -228,6 +228,11 @@ MARGIN_THRESHOLDS = {
 # Direct scraping toggle - set to False to disable direct HTTP scraping and use Apify only
 USE_DIRECT_SCRAPING = True
 
+# Start the Apify fallback alongside direct scraping instead of after it fails.
+# Cuts latency when direct scraping fails, but every listing then starts an Apify
+# run (aborted once the direct scrape wins, so only its elapsed time is billed).
+RACE_FALLBACK = False
+
 APIFY_ACTORS = {
     "mobile_de": "3x1t~mobile-de-scraper",  # Rental version (not PPR) - supports detail pages
     "autoscout24": "3x1t~autoscout24-scraper-ppr",  # Same developer as mobile.de
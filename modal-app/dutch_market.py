@@ -11,11 +11,26 @@ import re
 import asyncio
 
 from scrapers import VehicleData
-from utils import extract_model_variant
+from utils import extract_model_variant, has_digit
 from constants import APIFY_ACTORS
 from user_agents import get_random_headers, get_random_user_agent
 
 
+# Single-pass str.translate tables for cleaning scraped text
+_THOUSANDS_SEP_STRIP = str.maketrans("", "", ".,")  # "45.000" -> "45000"
+_MARKTPLAATS_MAKE_TABLE = str.maketrans({" ": "-", "ë": "e", "ö": "o"})  # "citroën" -> "citroen"
+
+# Model words where extract_base_model_name stops: engine/fuel indicators and
+# body style variants that should be excluded from the base model name
+_BASE_MODEL_STOP_WORDS = frozenset({
+    'tdi', 'tsi', 'tfsi', 'fsi', 'cdi', 'cgi', 'hdi', 'dci',
+    'cdti', 'jtd', 'mjet', 'bluehdi', 'crdi',
+    'sportback', 'sedan', 'saloon', 'wagon', 'estate', 'touring',
+    'avant', 'kombi', 'coupe', 'cabrio', 'cabriolet', 'convertible',
+    'roadster', 'limousine', 'hatchback', 'suv', 'van',
+})
+
+
 def _get_dutch_headers(referer: str = "") -> dict:
     """Get randomized browser headers with Dutch language preference."""
     headers = get_random_headers()
@@ -99,25 +114,13 @@ def extract_base_model_name(model: str) -> str:
         return model
 
     # Keep collecting parts until we hit engine specs, fuel type, or body style indicators
-    engine_indicators = ['tdi', 'tsi', 'tfsi', 'fsi', 'cdi', 'cgi', 'hdi', 'dci',
-                        'cdti', 'jtd', 'mjet', 'bluehdi', 'crdi']
-
-    # Body style variants that should be excluded from base model name
-    body_styles = ['sportback', 'sedan', 'saloon', 'wagon', 'estate', 'touring',
-                   'avant', 'kombi', 'coupe', 'cabrio', 'cabriolet', 'convertible',
-                   'roadster', 'limousine', 'hatchback', 'suv', 'van']
-
     base_parts = []
     for part in parts:
-        part_lower = part.lower()
         # Stop if we see engine size like "2.0" or "1.6"
-        if '.' in part and any(c.isdigit() for c in part):
-            break
-        # Stop if we see fuel type indicators
-        if part_lower in engine_indicators:
+        if '.' in part and has_digit(part):
             break
-        # Stop if we see body style variants
-        if part_lower in body_styles:
+        # Stop if we see fuel type indicators or body style variants
+        if part.lower() in _BASE_MODEL_STOP_WORDS:
             break
         # Stop if it looks like just a number (displacement without dot)
         if part.isdigit() and len(part) <= 2:
@@ -313,7 +316,7 @@ def build_marktplaats_search_url(vehicle: VehicleData) -> str:
     """
     # Marktplaats uses brand as subcategory: /l/auto-s/bmw/
     # Normalize make for URL path
-    make_url = vehicle.make.lower().replace(" ", "-").replace("ë", "e").replace("ö", "o")
+    make_url = vehicle.make.lower().translate(_MARKTPLAATS_MAKE_TABLE)
 
     # Handle special brand names
     brand_mapping = {
@@ -1110,14 +1113,14 @@ def parse_occasions_search_results(html: str) -> list[DutchComparable]:
                     price_match = re.search(r'€\s*(\d{1,3}(?:[.,]\d{3})*)', match)
                     price = 0
                     if price_match:
-                        price_str = price_match.group(1).replace('.', '').replace(',', '')
+                        price_str = price_match.group(1).translate(_THOUSANDS_SEP_STRIP)
                         price = int(price_str)
 
                     # Extract mileage: 50.000 km, 50000 km, etc.
                     mileage_match = re.search(r'(\d{1,3}(?:[.,]\d{3})*)\s*km', match, re.IGNORECASE)
                     mileage = 0
                     if mileage_match:
-                        mileage_str = mileage_match.group(1).replace('.', '').replace(',', '')
+                        mileage_str = mileage_match.group(1).translate(_THOUSANDS_SEP_STRIP)
                         mileage = int(mileage_str)
 
                     # Extract year: 2021, 2022, etc.
@@ -6,14 +6,165 @@ Uses Apify actors for mobile.de and AutoScout24.
 import httpx
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Any
+from typing import Optional, Any, Callable
 import asyncio
+import bisect
+import functools
+import http.cookiejar
 import re
 import json
+import logging
+import operator
+import os
+import time
+import traceback
+
+import orjson
 
 from constants import APIFY_ACTORS
-from utils import normalize_fuel_type, normalize_transmission, is_phev_model_name, estimate_phev_weighted_co2
-from user_agents import get_random_headers
+from utils import normalize_fuel_type, normalize_transmission, is_phev_model_name, estimate_phev_weighted_co2, has_digit
+from user_agents import get_rotating_headers
+
+# Per-listing parse diagnostics go through logging.debug, so their formatting is
+# skipped entirely unless debug logging is enabled
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# PARSERS: PRECOMPUTED TABLES
+# =============================================================================
+# Built once at import and never mutated afterwards, so they are safe to share
+# between concurrent requests without locking.
+
+# Embedded-JSON patterns for the direct scrapers. They run on the raw response
+# bytes so the HTML never has to be decoded to str before extraction.
+_NEXT_DATA_RE = re.compile(
+    rb'<script id="__NEXT_DATA__" type="application/json">(.*?)</script>', re.DOTALL
+)
+_INITIAL_STATE_RE = re.compile(rb'window\.__INITIAL_STATE__\s*=\s*(\{.*?\});', re.DOTALL)
+_JSON_LD_RE = re.compile(rb'<script type="application/ld\+json">(.*?)</script>', re.DOTALL)
+# JSON-LD @type values of a block that *is* the vehicle (used as listing data
+# as-is), plus Offer, which only wraps it: an Offer block is still picked, and
+# its listing is then found under the top-level fallback keys ("ad", ...).
+# The quoted byte forms are for the cheap pre-parse check.
+_JSON_LD_VEHICLE_TYPE_NAMES = ("Car", "Vehicle", "Product")
+_JSON_LD_LISTING_TYPE_NAMES = _JSON_LD_VEHICLE_TYPE_NAMES + ("Offer",)
+_JSON_LD_LISTING_TYPES = tuple(f'"{name}"'.encode() for name in _JSON_LD_LISTING_TYPE_NAMES)
+
+# Where the embedded JSON keeps the listing, in lookup order
+_MOBILE_NEXT_DATA_KEYS = ("ad", "listing", "vehicle", "data", "adDetails", "classifiedAd")
+_MOBILE_INITIAL_STATE_KEYS = ("ad", "listing", "vehicle", "classified", "data")
+_MOBILE_TOP_LEVEL_KEYS = ("ad", "listing", "vehicle", "data")
+_AUTOSCOUT24_PAGE_PROPS_KEYS = ("listingDetails", "listing", "vehicleDetails", "vehicle", "data")
+_AUTOSCOUT24_TOP_LEVEL_KEYS = ("listing", "vehicle", "data", "pageProps")
+
+# AutoScout24 vehicle fields, in order of preference: weighted (PHEV) CO2 and electric range
+_AUTOSCOUT24_WEIGHTED_CO2_FIELDS = (
+    "rawCo2EmissionCombinedWeighted", "co2EmissionWeightedCombined",
+    "co2EmissionWeighted", "rawCo2EmissionWeighted",
+)
+_AUTOSCOUT24_ELECTRIC_RANGE_FIELDS = ("rawElectricRange", "electricRange", "electricRangeInKm")
+
+# Source detection, case-insensitive so the URL is never lowercased
+_MOBILE_DE_SOURCE_RE = re.compile(r'mobile\.de', re.IGNORECASE)
+_AUTOSCOUT24_SOURCE_RE = re.compile(r'autoscout24\.(?:de|nl|be|com)|www\.autoscout24', re.IGNORECASE)
+
+# mobile.de listing URL: optional 2-letter language path segment, then the id= parameter
+_MOBILE_URL_RE = re.compile(r'mobile\.de/(?:([a-z]{2})/)?[^#]*?[?&]id=(\d+)')
+
+# First registration: MM/YYYY | YYYY/MM, YYYY-MM(-DD...) | YYYY alone or before "-"
+_REG_DATE_RE = re.compile(r"(\d{1,2})/(\d{4})$|(\d{4})[-/](\d{1,2})(?:-|$)|(\d{4})(?:(-)|$)")
+
+# Strips everything but digits in one C-level pass ("75,948 km" -> "75948")
+_NONDIGIT_RE = re.compile(r"\D+")
+
+# Brands recognised at the start of listing titles, in match-priority order
+_BRANDS = (
+    "Mercedes-Benz", "BMW", "Audi", "Volkswagen", "VW", "Porsche",
+    "Ford", "Opel", "Skoda", "Seat", "Renault", "Peugeot", "Citroën",
+    "Fiat", "Alfa Romeo", "Volvo", "Toyota", "Honda", "Mazda",
+    "Nissan", "Hyundai", "Kia", "Lexus", "Mini", "Land Rover",
+    "Jaguar", "Jeep", "Tesla", "Chevrolet", "Dodge",
+)
+_BRANDS_LC = tuple(brand.lower() for brand in _BRANDS)
+_BRAND_BY_FIRST_WORD = {brand.lower(): brand for brand in _BRANDS if " " not in brand}
+# One capture group per brand, tried in _BRANDS order; lastindex - 1 is the brand's index
+_BRANDS_RE = re.compile("|".join(f"({re.escape(brand)})" for brand in _BRANDS), re.IGNORECASE)
+
+# Descriptive title words that end the model name (body style, options, fuel)
+_MODEL_STOP_WORDS = frozenset({
+    "cabrio", "cabriolet", "limousine", "sedan", "wagon",
+    "kombi", "estate", "touring", "avant", "sportback",
+    "coupe", "suv", "roadster", "convertible", "van",
+    "panorama", "xenon", "navi", "automatik", "dsg",
+    "schalter", "benzin", "diesel", "hybrid",
+})
+
+# Displacement (litres) upper bounds and the engine-size label for each bucket
+_ENGINE_BUCKETS = (1.1, 1.3, 1.5, 1.7, 1.9, 2.1, 2.3, 2.6, 2.9, 3.1, 3.3, 3.6, 4.1)
+_ENGINE_LABELS = ("1.0", "1.2", "1.4", "1.6", "1.8", "2.0", "2.2", "2.5", "2.8", "3.0", "3.2", "3.5", "4.0")
+
+# CO2 (g/km) by fuel type when neither a value nor the power is known
+_DEFAULT_CO2 = {"petrol": 150, "diesel": 130, "electric": 0, "hybrid": 50, "lpg": 140}
+
+# kW -> CO2 estimate by fuel type: (g/km per kW, floor, cap); anything else uses
+# the petrol default. PHEV weighted CO2 is typically 30-60 g/km, so hybrids get a flat 45.
+_CO2_PARAMS = {
+    "diesel": (1.0, 100, 250),
+    "electric": (0.0, 0, 0),
+    "hybrid": (0.0, 45, 45),
+}
+_CO2_PARAMS_DEFAULT = (1.3, 100, 300)
+
+# VehicleData attributes and their JSON keys for vehicle_to_dict, in output order
+_VEHICLE_DICT_FIELDS = (
+    ("make", "make"),
+    ("model", "model"),
+    ("year", "year"),
+    ("mileage_km", "mileage_km"),
+    ("price_eur", "price_eur"),
+    ("fuel_type", "fuelType"),
+    ("transmission", "transmission"),
+    ("co2_gkm", "co2_gkm"),
+    ("first_registration_date", "firstRegistrationDate"),
+    ("listing_url", "listingUrl"),
+    ("source", "source"),
+    ("title", "title"),
+    ("features", "features"),
+    ("attributes", "attributes"),
+    ("is_phev", "isPhev"),
+)
+_VEHICLE_DICT_KEYS = tuple(key for _, key in _VEHICLE_DICT_FIELDS)
+_get_vehicle_fields = operator.attrgetter(*(attr for attr, _ in _VEHICLE_DICT_FIELDS))
+
+
+# =============================================================================
+# HTTP
+# =============================================================================
+
+# Shared HTTP client for listing pages and the Apify API. Reusing pooled
+# keep-alive (HTTP/2) connections avoids a TCP + TLS handshake per request.
+# Its cookie jar rejects every cookie, so site cookies never carry over from one
+# listing fetch to the next (which would tie the rotated User-Agents together).
+_CLIENT = httpx.AsyncClient(
+    http2=True,
+    follow_redirects=True,
+    cookies=http.cookiejar.CookieJar(policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])),
+    timeout=30.0,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+)
+
+# Successful scrapes are reused for a minute (user retries, double submits), and
+# concurrent requests for the same URL share one in-flight scrape
+_SCRAPE_CACHE_TTL = 60.0
+_SCRAPE_CACHE: dict[str, tuple[float, "ScrapeResult"]] = {}
+_SCRAPE_INFLIGHT: dict[str, asyncio.Task] = {}
+
+# Set SCRAPERS_DEBUG=1 to log full tracebacks and include them in error_details
+_SCRAPERS_DEBUG = os.environ.get("SCRAPERS_DEBUG", "").lower() in ("1", "true", "yes")
+
+# Listing pages are a few hundred KB; anything far larger is a bot-challenge or
+# error page, so the direct scrapers stop reading (and regex-scanning) past this
+_MAX_PAGE_BYTES = 2_000_000
 
 
 @dataclass
@@ -56,19 +207,12 @@ class ScrapeResult:
 
 def detect_source(url: str) -> str:
     """Detect the source website from URL."""
-    url_lower = url.lower()
-    if "mobile.de" in url_lower or "suchen.mobile.de" in url_lower:
+    if _MOBILE_DE_SOURCE_RE.search(url):
         return "mobile.de"
     # AutoScout24 - support all domains (.de, .nl, .be, .com)
     # Note: .nl/.be URLs are supported if the vehicle is located in Germany
     # User should verify the vehicle location is in Germany before importing
-    if any(domain in url_lower for domain in [
-        "autoscout24.de",
-        "autoscout24.nl",
-        "autoscout24.be",
-        "autoscout24.com",
-        "www.autoscout24",
-    ]):
+    if _AUTOSCOUT24_SOURCE_RE.search(url):
         return "autoscout24"
     return "unknown"
 
@@ -105,27 +249,15 @@ def normalize_mobile_de_url(url: str) -> str:
     - https://www.mobile.de/fr/vehicules/details.html?id=123 -> https://suchen.mobile.de/fahrzeuge/details.html?id=123
     - https://www.mobile.de/en/vehicles/details.html?id=123 -> https://suchen.mobile.de/fahrzeuge/details.html?id=123
     """
-    import re
-
-    # Extract the listing ID from the URL
-    listing_id = None
-    if "id=" in url:
-        listing_id = url.split("id=")[1].split("&")[0]
-
-    if not listing_id:
-        # If we can't extract the ID, return original URL
-        return url
-
-    # Check if this is a localized URL (contains language code like /nl/, /fr/, /en/, etc.)
-    # Pattern matches: mobile.de/xx/ where xx is a 2-letter language code
-    localized_pattern = r'mobile\.de/([a-z]{2})/'
-    if re.search(localized_pattern, url):
-        # Convert to standard German URL format
-        normalized_url = f"https://suchen.mobile.de/fahrzeuge/details.html?id={listing_id}"
+    # One scan captures the optional language code (/nl/, /fr/, /en/, ...) and the listing ID
+    match = _MOBILE_URL_RE.search(url)
+    if match and match.group(1):
+        # Convert localized URL to standard German URL format
+        normalized_url = f"https://suchen.mobile.de/fahrzeuge/details.html?id={match.group(2)}"
         print(f"[MOBILE.DE] Normalized URL from localized version: {url} -> {normalized_url}")
         return normalized_url
 
-    # Already in correct format or standard format
+    # Already in correct format, or no listing ID to normalize with
     return url
 
 
@@ -150,36 +282,42 @@ async def run_apify_actor(
     print(f"[APIFY] Starting actor: {actor_id}")
     print(f"[APIFY] Input data: {input_data}")
 
-    async with httpx.AsyncClient() as client:
-        # Start the actor run
-        start_url = f"https://api.apify.com/v2/acts/{actor_id}/runs"
+    # Start the actor run
+    start_url = f"https://api.apify.com/v2/acts/{actor_id}/runs"
 
-        response = await client.post(
-            start_url,
-            params={"token": token},
-            json=input_data,
-            timeout=30,
-        )
-        print(f"[APIFY] Start response status: {response.status_code}")
-        if response.status_code != 200 and response.status_code != 201:
-            print(f"[APIFY] Start response body: {response.text}")
-        response.raise_for_status()
-        run_data = response.json()
-        run_id = run_data["data"]["id"]
-        print(f"[APIFY] Actor run started with ID: {run_id}")
-
-        # Poll for completion
-        status_url = f"https://api.apify.com/v2/actor-runs/{run_id}"
-        start_time = asyncio.get_event_loop().time()
+    response = await _CLIENT.post(
+        start_url,
+        params={"token": token},
+        json=input_data,
+        timeout=30,
+    )
+    print(f"[APIFY] Start response status: {response.status_code}")
+    if response.status_code != 200 and response.status_code != 201:
+        print(f"[APIFY] Start response body: {response.text}")
+    response.raise_for_status()
+    run_data = response.json()
+    run_id = run_data["data"]["id"]
+    print(f"[APIFY] Actor run started with ID: {run_id}")
+
+    # Wait for completion. waitForFinish makes Apify hold the request open until
+    # the run finishes (max 60s), so one call usually replaces many polls.
+    # If it returns while the run is still going, back off before asking again.
+    status_url = f"https://api.apify.com/v2/actor-runs/{run_id}"
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+    retry_delay = 0.5
 
+    try:
         while True:
-            if asyncio.get_event_loop().time() - start_time > timeout:
+            remaining = timeout - (loop.time() - start_time)
+            if remaining <= 0:
                 raise TimeoutError(f"Actor run timed out after {timeout}s")
+            wait_for_finish = int(min(60, max(1, remaining)))
 
-            response = await client.get(
+            response = await _CLIENT.get(
                 status_url,
-                params={"token": token},
-                timeout=10,
+                params={"token": token, "waitForFinish": wait_for_finish},
+                timeout=wait_for_finish + 10,
             )
             response.raise_for_status()
             status_data = response.json()
@@ -192,20 +330,64 @@ async def run_apify_actor(
                 print(f"[APIFY] Actor run failed! Full response: {status_data}")
                 raise Exception(f"Actor run failed with status: {status}")
 
-            await asyncio.sleep(2)
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, 4)
+    except (asyncio.CancelledError, TimeoutError):
+        # Stopping the wait (e.g. the direct scrape won the race) does not stop
+        # the run on Apify's side, where it would keep going and keep billing
+        await _abort_apify_run(run_id, token)
+        raise
+
+    # Get results from default dataset
+    dataset_id = status_data["data"]["defaultDatasetId"]
+    results_url = f"https://api.apify.com/v2/datasets/{dataset_id}/items"
+
+    response = await _CLIENT.get(
+        results_url,
+        params={"token": token},
+        timeout=30,
+    )
+    response.raise_for_status()
 
-        # Get results from default dataset
-        dataset_id = status_data["data"]["defaultDatasetId"]
-        results_url = f"https://api.apify.com/v2/datasets/{dataset_id}/items"
+    return response.json()
 
-        response = await client.get(
-            results_url,
+
+async def _abort_apify_run(run_id: str, token: str) -> None:
+    """Abort an Apify actor run. Best effort: failures are only logged."""
+    try:
+        response = await _CLIENT.post(
+            f"https://api.apify.com/v2/actor-runs/{run_id}/abort",
             params={"token": token},
-            timeout=30,
+            timeout=10,
         )
-        response.raise_for_status()
+        print(f"[APIFY] Abort actor run {run_id}: HTTP {response.status_code}")
+    except Exception as e:
+        print(f"[APIFY] Could not abort actor run {run_id}: {e}")
+
+
+def _exception_details(log_prefix: str, e: Exception) -> str:
+    """
+    Log a scraper exception and build the error_details for its ScrapeResult.
+
+    Formatting the traceback walks the whole stack, so it is only done when
+    SCRAPERS_DEBUG is set; otherwise the details are just the exception text.
+    """
+    print(f"[{log_prefix}] Exception: {e}")
+    if not _SCRAPERS_DEBUG:
+        return str(e)
+    error_trace = traceback.format_exc()
+    print(f"[{log_prefix}] Traceback: {error_trace}")
+    return f"{str(e)} | {error_trace[:500]}"
 
-        return response.json()
+
+async def _read_capped(response: httpx.Response) -> Optional[bytearray]:
+    """Read a streamed response body, or return None once it exceeds _MAX_PAGE_BYTES."""
+    body = bytearray()
+    async for chunk in response.aiter_bytes():
+        body += chunk
+        if len(body) > _MAX_PAGE_BYTES:
+            return None
+    return body
 
 
 async def scrape_autoscout24_de_direct(url: str) -> ScrapeResult:
@@ -227,12 +409,10 @@ async def scrape_autoscout24_de_direct(url: str) -> ScrapeResult:
 
     try:
         # HTTP GET with randomized realistic headers
-        headers = get_random_headers()
+        headers = get_rotating_headers()
         headers["Referer"] = "https://www.autoscout24.de/"
 
-        async with httpx.AsyncClient(follow_redirects=True) as client:
-            response = await client.get(clean_url, headers=headers, timeout=30.0)
-
+        async with _CLIENT.stream("GET", clean_url, headers=headers, timeout=30.0) as response:
             # Check for error status codes
             if response.status_code == 404:
                 return ScrapeResult(
@@ -260,24 +440,25 @@ async def scrape_autoscout24_de_direct(url: str) -> ScrapeResult:
                 )
 
             response.raise_for_status()
-            html = response.text
+            html = await _read_capped(response)
+
+        if html is None:
+            print(f"[AUTOSCOUT24.DE DIRECT] Page exceeds {_MAX_PAGE_BYTES} bytes, not parsing")
+            return ScrapeResult(
+                success=False,
+                error_type="PARSE_ERROR",
+                error_message="Listing page too large to parse.",
+                error_details=f"Response exceeded {_MAX_PAGE_BYTES} bytes",
+            )
 
         print(f"[AUTOSCOUT24.DE DIRECT] HTTP {response.status_code}, HTML length: {len(html)}")
 
         # Extract __NEXT_DATA__ JSON (proven pattern from AutoScout24 NL)
-        match = re.search(
-            r'<script id="__NEXT_DATA__" type="application/json">(.*?)</script>',
-            html,
-            re.DOTALL
-        )
+        match = _NEXT_DATA_RE.search(html)
 
         if not match:
             # Try alternative: window.__INITIAL_STATE__
-            match = re.search(
-                r'window\.__INITIAL_STATE__\s*=\s*(\{.*?\});',
-                html,
-                re.DOTALL
-            )
+            match = _INITIAL_STATE_RE.search(html)
             if not match:
                 print("[AUTOSCOUT24.DE DIRECT] No __NEXT_DATA__ or __INITIAL_STATE__ found")
                 return ScrapeResult(
@@ -288,7 +469,7 @@ async def scrape_autoscout24_de_direct(url: str) -> ScrapeResult:
                 )
 
         try:
-            json_data = json.loads(match.group(1))
+            json_data = orjson.loads(match.group(1))
             print("[AUTOSCOUT24.DE DIRECT] Extracted JSON data successfully")
 
             # Navigate JSON structure to find vehicle data
@@ -300,7 +481,7 @@ async def scrape_autoscout24_de_direct(url: str) -> ScrapeResult:
                 page_props = json_data.get("props", {}).get("pageProps", {})
 
                 # Try different property names
-                for key in ["listingDetails", "listing", "vehicleDetails", "vehicle", "data"]:
+                for key in _AUTOSCOUT24_PAGE_PROPS_KEYS:
                     if key in page_props:
                         listing_data = page_props[key]
                         print(f"[AUTOSCOUT24.DE DIRECT] Found listing data in props.pageProps.{key}")
@@ -308,7 +489,7 @@ async def scrape_autoscout24_de_direct(url: str) -> ScrapeResult:
 
             if not listing_data:
                 # Try top-level keys
-                for key in ["listing", "vehicle", "data", "pageProps"]:
+                for key in _AUTOSCOUT24_TOP_LEVEL_KEYS:
                     if key in json_data:
                         listing_data = json_data[key]
                         print(f"[AUTOSCOUT24.DE DIRECT] Found listing data in top-level {key}")
@@ -356,18 +537,49 @@ async def scrape_autoscout24_de_direct(url: str) -> ScrapeResult:
             error_message="Request timed out after 30s.",
         )
     except Exception as e:
-        import traceback
-        error_trace = traceback.format_exc()
-        print(f"[AUTOSCOUT24.DE DIRECT] Exception: {e}")
-        print(f"[AUTOSCOUT24.DE DIRECT] Traceback: {error_trace}")
         return ScrapeResult(
             success=False,
             error_type="SCRAPER_ERROR",
             error_message="Direct scraping failed.",
-            error_details=f"{str(e)} | {error_trace[:500]}",
+            error_details=_exception_details("AUTOSCOUT24.DE DIRECT", e),
         )
 
 
+def _first_present_key(data: dict, keys: tuple) -> tuple[Any, str]:
+    """Return (value, key) for the first of keys present in data, else (None, "")."""
+    for key in keys:
+        if key in data:
+            return data[key], key
+    return None, ""
+
+
+def _extract_mobile_next_data(json_data: dict) -> tuple[Any, str]:
+    """Listing data from a Next.js payload: props.pageProps.*"""
+    page_props = json_data.get("props", {}).get("pageProps", {})
+    listing_data, key = _first_present_key(page_props, _MOBILE_NEXT_DATA_KEYS)
+    return listing_data, f"props.pageProps.{key}"
+
+
+def _extract_mobile_initial_state(json_data: dict) -> tuple[Any, str]:
+    """Listing data from window.__INITIAL_STATE__: common state keys."""
+    return _first_present_key(json_data, _MOBILE_INITIAL_STATE_KEYS)
+
+
+def _extract_mobile_json_ld(json_data: dict) -> tuple[Any, str]:
+    """JSON-LD is already the listing data for Car/Vehicle/Product types."""
+    if json_data.get("@type") in _JSON_LD_VEHICLE_TYPE_NAMES:
+        return json_data, "JSON-LD root"
+    return None, ""
+
+
+# Listing-data lookup per embedded-JSON extraction method in scrape_mobile_de_direct
+_MOBILE_LISTING_EXTRACTORS = {
+    "__NEXT_DATA__": _extract_mobile_next_data,
+    "__INITIAL_STATE__": _extract_mobile_initial_state,
+    "JSON-LD": _extract_mobile_json_ld,
+}
+
+
 async def scrape_mobile_de_direct(url: str) -> ScrapeResult:
     """
     Scrape mobile.de listing directly via HTTP (no Apify).
@@ -387,12 +599,10 @@ async def scrape_mobile_de_direct(url: str) -> ScrapeResult:
 
     try:
         # HTTP GET with randomized realistic headers
-        headers = get_random_headers()
+        headers = get_rotating_headers()
         headers["Referer"] = "https://suchen.mobile.de/"
 
-        async with httpx.AsyncClient(follow_redirects=True) as client:
-            response = await client.get(normalized_url, headers=headers, timeout=30.0)
-
+        async with _CLIENT.stream("GET", normalized_url, headers=headers, timeout=30.0) as response:
             # Check for error status codes
             if response.status_code == 404:
                 return ScrapeResult(
@@ -420,23 +630,28 @@ async def scrape_mobile_de_direct(url: str) -> ScrapeResult:
                 )
 
             response.raise_for_status()
-            html = response.text
+            html = await _read_capped(response)
+
+        if html is None:
+            print(f"[MOBILE.DE DIRECT] Page exceeds {_MAX_PAGE_BYTES} bytes, not parsing")
+            return ScrapeResult(
+                success=False,
+                error_type="PARSE_ERROR",
+                error_message="Listing page too large to parse.",
+                error_details=f"Response exceeded {_MAX_PAGE_BYTES} bytes",
+            )
 
         print(f"[MOBILE.DE DIRECT] HTTP {response.status_code}, HTML length: {len(html)}")
 
         # Try Pattern 1: __NEXT_DATA__
-        match = re.search(
-            r'<script id="__NEXT_DATA__" type="application/json">(.*?)</script>',
-            html,
-            re.DOTALL
-        )
+        match = _NEXT_DATA_RE.search(html)
 
         json_data = None
         extraction_method = None
 
         if match:
             try:
-                json_data = json.loads(match.group(1))
+                json_data = orjson.loads(match.group(1))
                 extraction_method = "__NEXT_DATA__"
                 print("[MOBILE.DE DIRECT] Extracted __NEXT_DATA__")
             except json.JSONDecodeError:
@@ -444,14 +659,10 @@ async def scrape_mobile_de_direct(url: str) -> ScrapeResult:
 
         # Try Pattern 2: window.__INITIAL_STATE__
         if not json_data:
-            match = re.search(
-                r'window\.__INITIAL_STATE__\s*=\s*(\{.*?\});',
-                html,
-                re.DOTALL
-            )
+            match = _INITIAL_STATE_RE.search(html)
             if match:
                 try:
-                    json_data = json.loads(match.group(1))
+                    json_data = orjson.loads(match.group(1))
                     extraction_method = "__INITIAL_STATE__"
                     print("[MOBILE.DE DIRECT] Extracted __INITIAL_STATE__")
                 except json.JSONDecodeError:
@@ -460,16 +671,15 @@ async def scrape_mobile_de_direct(url: str) -> ScrapeResult:
         # Try Pattern 3: JSON-LD structured data (may have multiple blocks)
         if not json_data:
             # Find ALL JSON-LD blocks
-            matches = re.finditer(
-                r'<script type="application/ld\+json">(.*?)</script>',
-                html,
-                re.DOTALL
-            )
-            for match in matches:
+            for match in _JSON_LD_RE.finditer(html):
+                block = match.group(1)
+                # Skip Organization/BreadcrumbList/WebSite blocks without parsing them
+                if b'"@type"' not in block or not any(t in block for t in _JSON_LD_LISTING_TYPES):
+                    continue
                 try:
-                    data = json.loads(match.group(1))
+                    data = orjson.loads(block)
                     # Look for Car/Vehicle/Product types (not Organization)
-                    if data.get("@type") in ["Car", "Vehicle", "Product", "Offer"]:
+                    if data.get("@type") in _JSON_LD_LISTING_TYPE_NAMES:
                         json_data = data
                         extraction_method = "JSON-LD"
                         print(f"[MOBILE.DE DIRECT] Extracted JSON-LD with @type: {data.get('@type')}")
@@ -487,39 +697,12 @@ async def scrape_mobile_de_direct(url: str) -> ScrapeResult:
             )
 
         # Navigate JSON structure to find vehicle/listing data
-        listing_data = None
-
-        if extraction_method == "__NEXT_DATA__":
-            # Try Next.js structure: props.pageProps.*
-            if "props" in json_data:
-                page_props = json_data.get("props", {}).get("pageProps", {})
-                for key in ["ad", "listing", "vehicle", "data", "adDetails", "classifiedAd"]:
-                    if key in page_props:
-                        listing_data = page_props[key]
-                        print(f"[MOBILE.DE DIRECT] Found data in props.pageProps.{key}")
-                        break
-
-        if not listing_data and extraction_method == "__INITIAL_STATE__":
-            # Try common state keys
-            for key in ["ad", "listing", "vehicle", "classified", "data"]:
-                if key in json_data:
-                    listing_data = json_data[key]
-                    print(f"[MOBILE.DE DIRECT] Found data in {key}")
-                    break
-
-        if not listing_data and extraction_method == "JSON-LD":
-            # JSON-LD is already the listing data for Car/Vehicle types
-            if json_data.get("@type") in ["Car", "Vehicle", "Product"]:
-                listing_data = json_data
-                print("[MOBILE.DE DIRECT] Using JSON-LD data directly")
+        listing_data, location = _MOBILE_LISTING_EXTRACTORS[extraction_method](json_data)
 
         if not listing_data:
             # Try top-level keys as fallback
-            for key in ["ad", "listing", "vehicle", "data"]:
-                if key in json_data:
-                    listing_data = json_data[key]
-                    print(f"[MOBILE.DE DIRECT] Found data in top-level {key}")
-                    break
+            listing_data, location = _first_present_key(json_data, _MOBILE_TOP_LEVEL_KEYS)
+            location = f"top-level {location}"
 
         if not listing_data:
             print(f"[MOBILE.DE DIRECT] Available keys: {list(json_data.keys())}")
@@ -529,6 +712,7 @@ async def scrape_mobile_de_direct(url: str) -> ScrapeResult:
                 error_message="Could not find listing data in JSON structure.",
                 error_details=f"Method: {extraction_method}, Keys: {list(json_data.keys())}",
             )
+        print(f"[MOBILE.DE DIRECT] Found data in {location}")
 
         # Parse using existing mobile.de parser
         vehicle = parse_mobile_de_result(listing_data, normalized_url)
@@ -555,18 +739,138 @@ async def scrape_mobile_de_direct(url: str) -> ScrapeResult:
             error_message="Request timed out after 30s.",
         )
     except Exception as e:
-        import traceback
-        error_trace = traceback.format_exc()
-        print(f"[MOBILE.DE DIRECT] Exception: {e}")
-        print(f"[MOBILE.DE DIRECT] Traceback: {error_trace}")
         return ScrapeResult(
             success=False,
             error_type="SCRAPER_ERROR",
             error_message="Direct scraping failed.",
-            error_details=f"{str(e)} | {error_trace[:500]}",
+            error_details=_exception_details("MOBILE.DE DIRECT", e),
         )
 
 
+def _as_dict(value: Any) -> dict:
+    """The value itself if it is a dict, otherwise an empty dict (for chained .get)."""
+    return value if isinstance(value, dict) else {}
+
+
+def _digits(s: str) -> str:
+    """Keep only the digits of a string ("1,984 cc" -> "1984")."""
+    return _NONDIGIT_RE.sub("", s)
+
+
+def _parse_int(value: Any) -> Optional[int]:
+    """
+    Convert a scraped int or digit string to int without raising.
+
+    Returns None for anything else, so malformed dates cost a check rather
+    than an exception.
+    """
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        value = value.strip()
+        if value.isdecimal():
+            return int(value)
+    return None
+
+
+def _parse_reg_date(value: str) -> tuple[Optional[int], Optional[int]]:
+    """
+    Parse a first-registration date into (year, month).
+
+    Accepts MM/YYYY, YYYY/MM, YYYY-MM with an optional day or time suffix,
+    and a bare YYYY (month 1). For "YYYY-<garbage>" only the year is known,
+    so month is None. Returns (None, None) when no year can be read.
+    """
+    match = _REG_DATE_RE.match(value.strip())
+    if not match:
+        return None, None
+    month, year, year_first, month_second, year_only, year_only_dash = match.groups()
+    if year:
+        year, month = int(year), int(month)
+    elif year_first:
+        year, month = int(year_first), int(month_second)
+    else:
+        year, month = int(year_only), (None if year_only_dash else 1)
+    if not year:
+        return None, None
+    return year, month
+
+
+def _month_start(year: int, month: Optional[int]) -> Optional[datetime]:
+    """First day of the given month, or None if year/month is out of range."""
+    if month is not None and 1 <= month <= 12 and datetime.min.year <= year <= datetime.max.year:
+        return datetime(year, month, 1)
+    return None
+
+
+def _estimate_co2_from_kw(kw: int, fuel_type: str) -> int:
+    """Rough CO2 (g/km) estimate from engine power for a normalized fuel type."""
+    per_kw, floor, cap = _CO2_PARAMS.get(fuel_type, _CO2_PARAMS_DEFAULT)
+    return min(cap, max(floor, int(kw * per_kw)))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_eur_price(price_str: str) -> int:
+    """
+    Parse a scraped price string into whole euros in a single scan.
+
+    European format uses . as thousands separator and , as decimal:
+    "28.480,20" -> 28480, "€ 28.480" -> 28480, "28,480" -> 28480,
+    "28480.20" -> 28480, "28480" -> 28480.
+    """
+    # Remove currency symbols and whitespace
+    price_str = price_str.replace("€", "").replace("EUR", "").strip()
+
+    digits = []
+    digits_before_comma = digits_before_dot = None
+    comma_count = dot_count = 0
+    last_separator = -1
+
+    for i, char in enumerate(price_str):
+        if char.isdecimal():
+            digits.append(char)
+        elif char == ",":
+            if digits_before_comma is None:
+                digits_before_comma = len(digits)
+            comma_count += 1
+            last_separator = i
+        elif char == ".":
+            if digits_before_dot is None:
+                digits_before_dot = len(digits)
+            dot_count += 1
+            last_separator = i
+
+    # Everything after the separator counts ("28,-0-" groups thousands), not just digits
+    chars_after_separator = len(price_str) - last_separator - 1
+
+    # Decide which separator starts the decimals (dropped) vs. groups thousands
+    integer_len = len(digits)
+    if comma_count and dot_count:
+        # "28.480,20" - dot is thousands, comma is decimal
+        integer_len = digits_before_comma
+    elif comma_count:
+        # "28480,20" is decimal, "28,480" is a thousands separator
+        if comma_count == 1 and chars_after_separator <= 2:
+            integer_len = digits_before_comma
+    elif dot_count:
+        # "28.480" is a thousands separator, "28480.20" is decimal
+        if not (dot_count == 1 and chars_after_separator == 3):
+            integer_len = digits_before_dot
+
+    digits = "".join(digits[:integer_len])
+    if not digits:
+        return 0
+
+    # Check if digits are duplicated (e.g., "2360023600" = "23600" twice)
+    if len(digits) >= 8:
+        half_len = len(digits) // 2
+        if digits[:half_len] == digits[half_len:half_len * 2]:
+            return int(digits[:half_len])
+        # Not duplicated, take first 5-6 digits
+        return int(digits[:6])
+    return int(digits)
+
+
 def parse_mobile_de_result(item: dict, url: str) -> VehicleData:
     """Parse mobile.de scraper result into VehicleData."""
     # The 3x1t~mobile-de-scraper-ppr actor returns attributes with keys like
@@ -577,17 +881,20 @@ def parse_mobile_de_result(item: dict, url: str) -> VehicleData:
     if isinstance(attrs, str):
         attrs = {}
 
-    # Helper function to get value from attrs with flexible key matching
-    def get_attr(keys):
-        """Try multiple key variations to find a value in attrs."""
+    # Lowercased-key view for case-insensitive lookups, built once per item.
+    # Reversed so the first of several case variants wins, as in a linear scan.
+    attrs_lower = {k.lower(): v for k, v in reversed(attrs.items())} if isinstance(attrs, dict) else {}
+
+    # Exact key first, then any case variant of it via the lowercase view,
+    # so candidate keys never need to be listed in several spellings
+    def _first(*keys):
+        """Return the value of the first candidate key present in attrs."""
         for key in keys:
             if key in attrs:
                 return attrs[key]
-            # Try lowercase
             key_lower = key.lower()
-            for attr_key, attr_val in attrs.items():
-                if attr_key.lower() == key_lower:
-                    return attr_val
+            if key_lower in attrs_lower:
+                return attrs_lower[key_lower]
         return None
 
     # Parse title first - it contains make and model
@@ -597,44 +904,41 @@ def parse_mobile_de_result(item: dict, url: str) -> VehicleData:
     make = "Unknown"
     model = "Unknown"
     if title:
-        # Common German car brands
-        brands = ["Mercedes-Benz", "BMW", "Audi", "Volkswagen", "VW", "Porsche",
-                  "Ford", "Opel", "Skoda", "Seat", "Renault", "Peugeot", "Citroën",
-                  "Fiat", "Alfa Romeo", "Volvo", "Toyota", "Honda", "Mazda",
-                  "Nissan", "Hyundai", "Kia", "Lexus", "Mini", "Land Rover",
-                  "Jaguar", "Jeep", "Tesla", "Chevrolet", "Dodge"]
-        for brand in brands:
-            if title.lower().startswith(brand.lower()):
-                make = brand
-                # Model is what comes after the brand
-                model_part = title[len(brand):].strip()
-                # Extract model with engine variant (e.g., "Golf 2.0 TDI" not just "Golf")
-                # Include more words to capture engine size and type
-                # Stop at common descriptive words that come after the core model
-                stop_words = ["cabrio", "cabriolet", "limousine", "sedan", "wagon",
-                             "kombi", "estate", "touring", "avant", "sportback",
-                             "coupe", "suv", "roadster", "convertible", "van",
-                             "panorama", "xenon", "navi", "automatik", "dsg",
-                             "schalter", "benzin", "diesel", "hybrid"]
-                model_words = []
-                for word in model_part.split():
-                    if word.lower() in stop_words:
-                        break
-                    model_words.append(word)
-                    # Take up to 5 words to capture variants like "Golf VII 2.0 TDI"
-                    if len(model_words) >= 5:
-                        break
-                model = " ".join(model_words) if model_words else model_part.split()[0] if model_part.split() else "Unknown"
-                break
-
-        if make == "Unknown":
-            # Fallback: first word is make, next words are model
-            parts = title.split()
-            if len(parts) >= 1:
-                make = parts[0]
-            if len(parts) >= 2:
-                # Take up to 4 words for model
-                model = " ".join(parts[1:min(5, len(parts))])
+        # Common German car brands - O(1) lookup on the first word, with a
+        # prefix scan for multi-word brands like "Alfa Romeo"
+        title_lower = title.lower()
+        brand = _BRAND_BY_FIRST_WORD.get(title_lower.split(" ", 1)[0])
+        if brand is None:
+            for candidate, candidate_lc in zip(_BRANDS, _BRANDS_LC):
+                if title_lower.startswith(candidate_lc):
+                    brand = candidate
+                    break
+        if brand:
+            make = brand
+            # Model is what comes after the brand (split once, reused below)
+            model_part_words = title[len(brand):].split()
+            # Extract model with engine variant (e.g., "Golf 2.0 TDI" not just "Golf")
+            # Include more words to capture engine size and type
+            # Stop at common descriptive words that come after the core model
+            model_words = []
+            for word in model_part_words:
+                if word.lower() in _MODEL_STOP_WORDS:
+                    break
+                model_words.append(word)
+                # Take up to 5 words to capture variants like "Golf VII 2.0 TDI"
+                if len(model_words) >= 5:
+                    break
+            if model_words:
+                model = " ".join(model_words)
+            elif model_part_words:
+                model = model_part_words[0]
+        else:
+            # Fallback: first word is make, next words (up to 4) are model
+            title_words = title.split()
+            if title_words:
+                make = title_words[0]
+            if len(title_words) >= 2:
+                model = " ".join(title_words[1:5])
 
     # Override with explicit make/model if available
     if item.get("brand"):
@@ -644,40 +948,25 @@ def parse_mobile_de_result(item: dict, url: str) -> VehicleData:
 
     # Get first registration from attributes - key is "First Registration"
     first_reg_str = (
-        get_attr(["First Registration", "firstRegistration", "registration"]) or
+        _first("First Registration", "firstRegistration", "registration") or
         item.get("firstRegistration") or
         ""
     )
 
     first_reg = datetime.now()
-    year = datetime.now().year
+    year = first_reg.year
 
     if first_reg_str:
-        first_reg_str = str(first_reg_str).strip()
-        try:
-            if "/" in first_reg_str:
-                # Format: "09/2016"
-                parts = first_reg_str.split("/")
-                if len(parts) == 2:
-                    if len(parts[0]) == 4:  # YYYY/MM
-                        year = int(parts[0])
-                        month = int(parts[1])
-                    else:  # MM/YYYY
-                        month = int(parts[0])
-                        year = int(parts[1])
-                    first_reg = datetime(year, month, 1)
-            elif "-" in first_reg_str:
-                parts = first_reg_str.split("-")
-                year = int(parts[0])
-                month = int(parts[1]) if len(parts) > 1 else 1
-                first_reg = datetime(year, month, 1)
-        except:
-            pass
+        # Format: "09/2016", "2016/09", "2016-09(-01)" or "2016"
+        reg_year, reg_month = _parse_reg_date(str(first_reg_str))
+        if reg_year is not None:
+            year = reg_year
+            first_reg = _month_start(reg_year, reg_month) or first_reg
 
     # Get mileage from attributes - key is "Mileage"
     # IMPORTANT: handle numeric types (float like 12499.0) before string conversion
     mileage_val = (
-        get_attr(["Mileage", "mileage", "km"]) or
+        _first("Mileage", "km") or
         item.get("mileage") or
         0
     )
@@ -689,74 +978,17 @@ def parse_mobile_de_result(item: dict, url: str) -> VehicleData:
             mileage = int(float(str(mileage_val)))
         except (ValueError, TypeError):
             # Parse "75,948 km" -> 75948
-            mileage = int("".join(filter(str.isdigit, str(mileage_val))) or 0)
+            mileage = int(_digits(str(mileage_val)) or 0)
 
     # Get price - this one is tricky, the actor may return various formats
-    # European format uses . as thousands separator and , as decimal
-    # E.g., "28.480,20" or "€ 28.480" or "28480.2"
+    # E.g., "28.480,20" or "€ 28.480" or "28480.2" (see _parse_eur_price)
     price_raw = item.get("price")
 
     price = 0
     if price_raw is not None:
-        price_str = str(price_raw).strip()
-        print(f"[MOBILE.DE] Raw price value: {repr(price_raw)}")
-
-        # Remove currency symbols and whitespace
-        price_str = price_str.replace("€", "").replace("EUR", "").strip()
-
-        # Handle European number format:
-        # "28.480,20" -> thousands separator is ., decimal is ,
-        # "28.480" -> could be 28480 or 28.480 (ambiguous, assume thousands sep)
-        # "28480.20" -> decimal point format (28480.20 euros)
-        # "28480" -> plain integer
-
-        if "," in price_str and "." in price_str:
-            # European format: "28.480,20" - dot is thousands, comma is decimal
-            # Remove thousands separator, replace decimal comma with dot
-            price_str = price_str.replace(".", "").replace(",", ".")
-        elif "," in price_str:
-            # Only comma: could be "28,480" (European) or "28480,20" (decimal)
-            parts = price_str.split(",")
-            if len(parts) == 2 and len(parts[1]) <= 2:
-                # Decimal: "28480,20" -> "28480.20"
-                price_str = price_str.replace(",", ".")
-            else:
-                # Thousands separator: "28,480" -> "28480"
-                price_str = price_str.replace(",", "")
-        elif "." in price_str:
-            # Only dot: could be "28.480" (thousands) or "28480.20" (decimal)
-            parts = price_str.split(".")
-            if len(parts) == 2:
-                if len(parts[1]) <= 2:
-                    # Decimal: "28480.20" -> keep as is (will truncate)
-                    pass
-                elif len(parts[1]) == 3:
-                    # Thousands separator: "28.480" -> "28480"
-                    price_str = price_str.replace(".", "")
-
-        # Now extract the integer part (ignore decimals)
-        # Split on decimal point and take first part
-        if "." in price_str:
-            price_str = price_str.split(".")[0]
-
-        digits = "".join(filter(str.isdigit, price_str))
-
-        if digits:
-            # Check if digits are duplicated (e.g., "2360023600" = "23600" twice)
-            if len(digits) >= 8:
-                half_len = len(digits) // 2
-                first_half = digits[:half_len]
-                second_half = digits[half_len:half_len*2]
-                if first_half == second_half:
-                    # Duplicated! Use just the first half
-                    price = int(first_half)
-                else:
-                    # Not duplicated, take first 5-6 digits
-                    price = int(digits[:min(6, len(digits))])
-            else:
-                price = int(digits)
-
-        print(f"[MOBILE.DE] Parsed price: {price}")
+        logger.debug("[MOBILE.DE] Raw price value: %r", price_raw)
+        price = _parse_eur_price(str(price_raw))
+        logger.debug("[MOBILE.DE] Parsed price: %s", price)
 
     # Sanity check
     if price < 100 or price > 500000:
@@ -764,16 +996,16 @@ def parse_mobile_de_result(item: dict, url: str) -> VehicleData:
 
     # Get fuel type from attributes - key is "Fuel"
     fuel_raw = (
-        get_attr(["Fuel", "fuel", "fuelType", "Drive type"]) or
+        _first("Fuel", "fuelType", "Drive type") or
         item.get("fuel") or
         "petrol"
     )
     fuel_type = normalize_fuel_type(str(fuel_raw))
-    print(f"[MOBILE.DE] Fuel raw: {fuel_raw} → normalized: {fuel_type}")
+    logger.debug("[MOBILE.DE] Fuel raw: %s → normalized: %s", fuel_raw, fuel_type)
 
     # Get transmission from attributes - key is "Transmission"
     trans_raw = (
-        get_attr(["Transmission", "transmission", "gearbox"]) or
+        _first("Transmission", "gearbox") or
         item.get("transmission") or
         "automatic"
     )
@@ -782,21 +1014,18 @@ def parse_mobile_de_result(item: dict, url: str) -> VehicleData:
     # ENHANCEMENT: If model is too generic (just 1-2 words like "Golf" or "3 Series"),
     # try to enrich it with engine info from attributes
     # This helps find more accurate market comparables
-    if len(model.split()) <= 2 and not any(char.isdigit() for char in model):
+    if len(model.split()) <= 2 and not has_digit(model):
         # Model is generic (e.g., "Golf", "3 Series") without engine size
         # First try to get actual engine displacement from attributes
         engine_size = None
-        cubic_capacity = get_attr([
-            "Cubic Capacity", "Cubic capacity", "cubic capacity",
-            "Hubraum", "hubraum", "Engine Size", "engine size",
-            "Displacement", "displacement", "ccm", "cc"
-        ])
+        cubic_capacity = _first(
+            "Cubic Capacity", "Hubraum", "Engine Size", "Displacement", "ccm", "cc"
+        )
 
         if cubic_capacity:
-            print(f"[MOBILE.DE] Cubic capacity attribute: {cubic_capacity}")
+            logger.debug("[MOBILE.DE] Cubic capacity attribute: %s", cubic_capacity)
             # Parse values like "1,984 cc", "1984 ccm", "2.0 L", "1984"
-            cc_str = str(cubic_capacity).lower().replace(",", "").replace(".", "")
-            cc_digits = "".join(filter(str.isdigit, cc_str))
+            cc_digits = _digits(str(cubic_capacity))
             if cc_digits:
                 cc = int(cc_digits)
                 # Convert cc to liters (e.g., 1984 cc = 2.0 L)
@@ -804,36 +1033,11 @@ def parse_mobile_de_result(item: dict, url: str) -> VehicleData:
                     liters = cc / 1000
                 else:
                     liters = cc  # Already in liters (rare)
-                # Round to common engine sizes
-                if liters < 1.1:
-                    engine_size = "1.0"
-                elif liters < 1.3:
-                    engine_size = "1.2"
-                elif liters < 1.5:
-                    engine_size = "1.4"
-                elif liters < 1.7:
-                    engine_size = "1.6"
-                elif liters < 1.9:
-                    engine_size = "1.8"
-                elif liters < 2.1:
-                    engine_size = "2.0"
-                elif liters < 2.3:
-                    engine_size = "2.2"
-                elif liters < 2.6:
-                    engine_size = "2.5"
-                elif liters < 2.9:
-                    engine_size = "2.8"
-                elif liters < 3.1:
-                    engine_size = "3.0"
-                elif liters < 3.3:
-                    engine_size = "3.2"
-                elif liters < 3.6:
-                    engine_size = "3.5"
-                elif liters < 4.1:
-                    engine_size = "4.0"
-                else:
-                    engine_size = f"{liters:.1f}"
-                print(f"[MOBILE.DE] Parsed engine size: {cc} cc → {engine_size} L")
+                # Round to common engine sizes; bisect_right keeps
+                # each upper bound exclusive ("< 1.1" -> "1.0", 1.1 -> "1.2")
+                idx = bisect.bisect_right(_ENGINE_BUCKETS, liters)
+                engine_size = _ENGINE_LABELS[idx] if idx < len(_ENGINE_LABELS) else f"{liters:.1f}"
+                logger.debug("[MOBILE.DE] Parsed engine size: %s cc → %s L", cc, engine_size)
 
         # Build engine designation with fuel type suffix
         if engine_size:
@@ -849,10 +1053,10 @@ def parse_mobile_de_result(item: dict, url: str) -> VehicleData:
                 model = f"{model} {engine_size} {engine_suffix}"
             else:
                 model = f"{model} {engine_size}"
-            print(f"[MOBILE.DE] Enriched model from '{original_model}' to '{model}' based on actual displacement")
+            logger.debug("[MOBILE.DE] Enriched model from '%s' to '%s' based on actual displacement", original_model, model)
         else:
             # Fallback: No displacement found, log available attributes for debugging
-            print(f"[MOBILE.DE] No cubic capacity found. Available attributes: {list(attrs.keys())}")
+            logger.debug("[MOBILE.DE] No cubic capacity found. Available attributes: %s", list(attrs.keys()))
 
     # PHEV detection: check model name for known PHEV indicators
     is_phev = False
@@ -860,31 +1064,21 @@ def parse_mobile_de_result(item: dict, url: str) -> VehicleData:
     if fuel_type == "hybrid":
         is_phev = True
     elif is_phev_model_name(model, make):
-        print(f"[MOBILE.DE] Detected PHEV from model name: {model}, overriding fuel to 'hybrid'")
+        logger.debug("[MOBILE.DE] Detected PHEV from model name: %s, overriding fuel to 'hybrid'", model)
         fuel_type = "hybrid"
         is_phev = True
 
     # Get CO2 - often not available, estimate based on engine
-    default_co2 = {"petrol": 150, "diesel": 130, "electric": 0, "hybrid": 50, "lpg": 140}.get(fuel_type, 150)
-    co2 = default_co2
-    power_str = get_attr(["Power", "power", "kW"])
+    co2 = _DEFAULT_CO2.get(fuel_type, 150)
+    power_str = _first("Power", "kW")
     if power_str:
         # Parse "115 kW (156 hp)" -> estimate CO2 based on power
-        kw_match = "".join(filter(str.isdigit, str(power_str).split("kW")[0]))
+        kw_match = _digits(str(power_str).split("kW")[0])
         if kw_match:
-            kw = int(kw_match)
-            # Rough estimate: ~1.2-1.5 g/km per kW for petrol
-            if fuel_type == "diesel":
-                co2 = min(250, max(100, int(kw * 1.0)))
-            elif fuel_type == "electric":
-                co2 = 0
-            elif fuel_type == "hybrid":
-                # PHEV weighted CO2 is typically 30-60 g/km
-                co2 = 45
+            co2 = _estimate_co2_from_kw(int(kw_match), fuel_type)
+            if fuel_type == "hybrid":
                 co2_note = "PHEV CO2 geschat op 45 g/km. Controleer de officiële gewogen CO2 voor exacte BPM."
-                print(f"[MOBILE.DE] Estimating PHEV weighted CO2: {co2} g/km")
-            else:
-                co2 = min(300, max(100, int(kw * 1.3)))
+                logger.debug("[MOBILE.DE] Estimating PHEV weighted CO2: %s g/km", co2)
 
     # Use the URL returned by Apify if available, otherwise use the provided URL
     actual_url = item.get("url", item.get("listingUrl", url))
@@ -928,7 +1122,7 @@ def parse_autoscout24_result(item: dict, url: str) -> VehicleData:
 def _parse_autoscout24_direct(item: dict, url: str) -> VehicleData:
     """Parse AutoScout24 direct scraping format (nested structure)."""
     vehicle = item.get("vehicle", {})
-    prices = item.get("prices", {})
+    prices = _as_dict(item.get("prices"))
 
     # Make and Model - direct from vehicle.*
     make = vehicle.get("make", "Unknown")
@@ -945,9 +1139,9 @@ def _parse_autoscout24_direct(item: dict, url: str) -> VehicleData:
             model = f"{model} {variant}".strip()
 
     # Price - from prices.public.priceRaw (clean integer)
-    price = prices.get("public", {}).get("priceRaw", 0) or 0
+    price = _as_dict(prices.get("public")).get("priceRaw", 0) or 0
     if not price:
-        price = prices.get("dealer", {}).get("priceRaw", 0) or 0
+        price = _as_dict(prices.get("dealer")).get("priceRaw", 0) or 0
 
     # Mileage - prefer mileageInKmRaw (clean integer) over mileageInKm (formatted string like "57.002 km")
     mileage = 0
@@ -962,37 +1156,24 @@ def _parse_autoscout24_direct(item: dict, url: str) -> VehicleData:
             mileage = int(mileage_raw)
         else:
             # String like "57.002 km" - strip non-digits (dots are thousands separators)
-            mileage = int("".join(filter(str.isdigit, str(mileage_raw))) or 0)
+            mileage = int(_digits(str(mileage_raw)) or 0)
 
     # First Registration - parse "11/2010" format
     first_reg_str = str(vehicle.get("firstRegistrationDate", ""))
     first_reg = datetime.now()
-    year = datetime.now().year
+    year = first_reg.year
 
     if first_reg_str and first_reg_str != "None":
-        try:
-            if "/" in first_reg_str:
-                # Format: MM/YYYY
-                parts = first_reg_str.split("/")
-                if len(parts) == 2:
-                    month = int(parts[0])
-                    year = int(parts[1])
-                    first_reg = datetime(year, month, 1)
-            elif "-" in first_reg_str:
-                # Format: YYYY-MM or YYYY-MM-DD
-                parts = first_reg_str.split("-")
-                year = int(parts[0])
-                month = int(parts[1]) if len(parts) > 1 else 1
-                first_reg = datetime(year, month, 1)
-        except:
-            pass
+        # Format: MM/YYYY, YYYY-MM or YYYY-MM-DD
+        reg_year, reg_month = _parse_reg_date(first_reg_str)
+        if reg_year is not None:
+            year = reg_year
+            first_reg = _month_start(reg_year, reg_month) or first_reg
 
     # Override with production year if available
-    if vehicle.get("productionYear"):
-        try:
-            year = int(vehicle.get("productionYear"))
-        except:
-            pass
+    production_year = _parse_int(vehicle.get("productionYear"))
+    if production_year:
+        year = production_year
 
     # Fuel type - from fuelCategory.formatted (handles dict or string)
     fuel_category = vehicle.get("fuelCategory", "petrol")
@@ -1001,7 +1182,7 @@ def _parse_autoscout24_direct(item: dict, url: str) -> VehicleData:
     else:
         fuel_raw = fuel_category
     fuel_type = normalize_fuel_type(str(fuel_raw))
-    print(f"[AUTOSCOUT24.DE DIRECT] Fuel raw: {fuel_raw} → normalized: {fuel_type}")
+    logger.debug("[AUTOSCOUT24.DE DIRECT] Fuel raw: %s → normalized: %s", fuel_raw, fuel_type)
 
     # PHEV detection: also check model name for known PHEV indicators
     # This catches cases where fuelCategory doesn't clearly indicate PHEV
@@ -1009,7 +1190,7 @@ def _parse_autoscout24_direct(item: dict, url: str) -> VehicleData:
     if fuel_type == "hybrid":
         is_phev = True
     elif is_phev_model_name(model, make):
-        print(f"[AUTOSCOUT24.DE DIRECT] Detected PHEV from model name: {model}, overriding fuel to 'hybrid'")
+        logger.debug("[AUTOSCOUT24.DE DIRECT] Detected PHEV from model name: %s, overriding fuel to 'hybrid'", model)
         fuel_type = "hybrid"
         is_phev = True
 
@@ -1023,15 +1204,8 @@ def _parse_autoscout24_direct(item: dict, url: str) -> VehicleData:
     co2_note = ""
     co2_found = False
 
-    # Default CO2 by fuel type
-    default_co2 = {
-        "petrol": 150, "diesel": 130, "electric": 0,
-        "hybrid": 50, "lpg": 140,
-    }.get(fuel_type, 150)
-
     # Try weighted CO2 fields first (important for PHEVs)
-    for co2_field in ["rawCo2EmissionCombinedWeighted", "co2EmissionWeightedCombined",
-                       "co2EmissionWeighted", "rawCo2EmissionWeighted"]:
+    for co2_field in _AUTOSCOUT24_WEIGHTED_CO2_FIELDS:
         co2_weighted_data = vehicle.get(co2_field)
         if co2_weighted_data:
             raw_val = co2_weighted_data.get("raw") if isinstance(co2_weighted_data, dict) else co2_weighted_data
@@ -1040,38 +1214,34 @@ def _parse_autoscout24_direct(item: dict, url: str) -> VehicleData:
                     co2 = int(raw_val)
                     if 0 <= co2 <= 400:
                         co2_found = True
-                        print(f"[AUTOSCOUT24.DE DIRECT] Using weighted CO2 from {co2_field}: {co2}")
+                        logger.debug("[AUTOSCOUT24.DE DIRECT] Using weighted CO2 from %s: %s", co2_field, co2)
                         break
                 except (ValueError, TypeError):
                     pass
 
     # Fallback to regular CO2 field
     if not co2_found:
-        co2_data = vehicle.get("co2emissionInGramPerKmWithFallback", {})
-        if isinstance(co2_data, dict):
-            co2_raw = co2_data.get("raw")
-            if co2_raw and co2_raw != "None":
-                try:
-                    parsed_co2 = int(co2_raw)
-                    if 0 <= parsed_co2 <= 400:
-                        co2 = parsed_co2
-                        co2_found = True
-                except (ValueError, TypeError):
-                    pass
+        co2_raw = _as_dict(vehicle.get("co2emissionInGramPerKmWithFallback")).get("raw")
+        if co2_raw and co2_raw != "None":
+            try:
+                parsed_co2 = int(co2_raw)
+                if 0 <= parsed_co2 <= 400:
+                    co2 = parsed_co2
+                    co2_found = True
+            except (ValueError, TypeError):
+                pass
 
     # Also try co2emissionInGramPerKm (without "WithFallback")
     if not co2_found:
-        co2_alt = vehicle.get("co2emissionInGramPerKm", {})
-        if isinstance(co2_alt, dict):
-            raw_val = co2_alt.get("raw")
-            if raw_val and str(raw_val) != "None":
-                try:
-                    parsed_co2 = int(raw_val)
-                    if 0 <= parsed_co2 <= 400:
-                        co2 = parsed_co2
-                        co2_found = True
-                except (ValueError, TypeError):
-                    pass
+        raw_val = _as_dict(vehicle.get("co2emissionInGramPerKm")).get("raw")
+        if raw_val and str(raw_val) != "None":
+            try:
+                parsed_co2 = int(raw_val)
+                if 0 <= parsed_co2 <= 400:
+                    co2 = parsed_co2
+                    co2_found = True
+            except (ValueError, TypeError):
+                pass
 
     # For PHEVs: check if CO2 is the non-weighted (ICE-only) value
     # If CO2 > 100 for a PHEV, it's almost certainly NOT the weighted value
@@ -1079,7 +1249,7 @@ def _parse_autoscout24_direct(item: dict, url: str) -> VehicleData:
         co2_depleted = co2
         # Try to get electric range for better estimation
         electric_range = 50  # Default assumption for PHEVs
-        for range_field in ["rawElectricRange", "electricRange", "electricRangeInKm"]:
+        for range_field in _AUTOSCOUT24_ELECTRIC_RANGE_FIELDS:
             range_data = vehicle.get(range_field)
             if range_data:
                 raw_val = range_data.get("raw") if isinstance(range_data, dict) else range_data
@@ -1087,7 +1257,7 @@ def _parse_autoscout24_direct(item: dict, url: str) -> VehicleData:
                     try:
                         electric_range = int(float(str(raw_val)))
                         if electric_range > 0:
-                            print(f"[AUTOSCOUT24.DE DIRECT] Electric range from {range_field}: {electric_range} km")
+                            logger.debug("[AUTOSCOUT24.DE DIRECT] Electric range from %s: %s km", range_field, electric_range)
                             break
                     except (ValueError, TypeError):
                         pass
@@ -1096,26 +1266,18 @@ def _parse_autoscout24_direct(item: dict, url: str) -> VehicleData:
         co2_note = (f"PHEV gewogen CO2 geschat op {co2} g/km (WLTP utility factor, "
                     f"bereik {electric_range} km, ICE-only {co2_depleted} g/km). "
                     f"Controleer de officiële gewogen CO2 voor exacte BPM.")
-        print(f"[AUTOSCOUT24.DE DIRECT] PHEV: CO2 {co2_depleted} → weighted estimate {co2} g/km (range {electric_range} km)")
+        logger.debug("[AUTOSCOUT24.DE DIRECT] PHEV: CO2 %s → weighted estimate %s g/km (range %s km)", co2_depleted, co2, electric_range)
 
     # If CO2 not available at all, estimate from power
     if not co2_found:
-        co2 = default_co2
+        co2 = _DEFAULT_CO2.get(fuel_type, 150)
         power_kw_str = str(vehicle.get("powerInKw", ""))
-        kw_digits = "".join(filter(str.isdigit, power_kw_str.split()[0] if power_kw_str.split() else power_kw_str))
+        kw_digits = _digits(power_kw_str.split()[0] if power_kw_str.split() else power_kw_str)
         if kw_digits:
-            kw = int(kw_digits)
-            if fuel_type == "diesel":
-                co2 = min(250, max(100, int(kw * 1.0)))
-            elif fuel_type == "electric":
-                co2 = 0
-            elif fuel_type == "hybrid":
-                # PHEV weighted CO2 is typically 30-60 g/km
-                co2 = 45
+            co2 = _estimate_co2_from_kw(int(kw_digits), fuel_type)
+            if fuel_type == "hybrid":
                 co2_note = "PHEV CO2 geschat op 45 g/km (geen exacte data beschikbaar). Controleer de officiële gewogen CO2 voor exacte BPM."
-                print(f"[AUTOSCOUT24.DE DIRECT] Estimating PHEV weighted CO2: {co2} g/km")
-            else:
-                co2 = min(300, max(100, int(kw * 1.3)))
+                logger.debug("[AUTOSCOUT24.DE DIRECT] Estimating PHEV weighted CO2: %s g/km", co2)
 
     # Title - from imgAltText or construct from make/model
     title = item.get("imgAltText", f"{make} {model}")
@@ -1147,57 +1309,32 @@ def _parse_autoscout24_direct(item: dict, url: str) -> VehicleData:
     )
 
 
-def _parse_autoscout24_apify(item: dict, url: str) -> VehicleData:
-    """Parse AutoScout24 Apify format (flat structure)."""
-    # The 3x1t~autoscout24-scraper-ppr returns data with:
-    # - brand, model at top level
-    # - attributes dict with keys like "First Registration", "Mileage", "Fuel"
-    # - price as nested object: price.total.amount
-    attrs = item.get("attributes", {})
-    if isinstance(attrs, str):
-        attrs = {}
+def _parse_apify_price(value: Any) -> int:
+    """
+    Parse an Apify price value into whole euros.
 
+    Everything after the first comma is the decimal part; dots, spaces and
+    currency signs are dropped ("€ 23.600,50" -> 23600, "23600" -> 23600).
+    """
+    return int(_digits(str(value).partition(",")[0]) or 0)
 
-    # Helper function to get value from item or attrs with flexible key matching
-    def get_field(keys):
-        """Try multiple key variations to find a value."""
-        for key in keys:
-            # Try item first
-            if key in item and item[key]:
-                return item[key]
-            # Try attrs
-            if key in attrs and attrs[key]:
-                return attrs[key]
-            # Try lowercase/case-insensitive
-            key_lower = key.lower()
-            for d in [item, attrs]:
-                for k, v in d.items():
-                    if k.lower() == key_lower and v:
-                        return v
-        return None
 
+def _parse_as24_make_model(get_field: Callable[[tuple], Any], title: str) -> tuple[str, str]:
+    """Make and model from their fields, falling back to the listing title."""
     # Try multiple field names for make/model (different scrapers use different names)
-    make = get_field(["make", "brand", "Brand", "Make", "manufacturer"]) or "Unknown"
-    model = get_field(["model", "modelLine", "Model", "ModelLine"]) or "Unknown"
+    make = get_field(("make", "brand", "Brand", "Make", "manufacturer")) or "Unknown"
+    model = get_field(("model", "modelLine", "Model", "ModelLine")) or "Unknown"
 
     # Parse make/model from title if needed
-    title = get_field(["title", "name", "Title", "Name"]) or ""
     if (make == "Unknown" or model == "Unknown") and title:
         # Extract from title like "BMW 320d xDrive..."
-        brands = ["Mercedes-Benz", "BMW", "Audi", "Volkswagen", "VW", "Porsche",
-                  "Ford", "Opel", "Skoda", "Seat", "Renault", "Peugeot", "Citroën",
-                  "Fiat", "Alfa Romeo", "Volvo", "Toyota", "Honda", "Mazda",
-                  "Nissan", "Hyundai", "Kia", "Lexus", "Mini", "Land Rover",
-                  "Jaguar", "Jeep", "Tesla", "Chevrolet", "Dodge"]
-        for brand in brands:
-            if title.lower().startswith(brand.lower()):
-                if make == "Unknown":
-                    make = brand
-                if model == "Unknown":
-                    model_part = title[len(brand):].strip()
-                    model_words = model_part.split()[:3]
-                    model = " ".join(model_words)
-                break
+        brand_match = _BRANDS_RE.match(title)
+        if brand_match:
+            if make == "Unknown":
+                make = _BRANDS[brand_match.lastindex - 1]
+            if model == "Unknown":
+                model_words = title[brand_match.end():].split()[:3]
+                model = " ".join(model_words)
         if make == "Unknown" and title:
             parts = title.split()
             if len(parts) >= 1:
@@ -1205,141 +1342,98 @@ def _parse_autoscout24_apify(item: dict, url: str) -> VehicleData:
             if len(parts) >= 2 and model == "Unknown":
                 model = " ".join(parts[1:3])
 
+    return make, model
+
+
+def _parse_as24_registration(get_field: Callable[[tuple], Any]) -> tuple[datetime, int]:
+    """First registration date and model year (defaults to now)."""
     # Get first registration - handle multiple formats
-    first_reg_str = get_field([
+    first_reg_str = get_field((
         "firstRegistration", "registration", "firstReg",
         "First Registration", "Registration", "year"
-    ]) or ""
+    )) or ""
     first_reg = datetime.now()
-    year = datetime.now().year
+    year = first_reg.year
 
     if first_reg_str:
-        try:
-            first_reg_str = str(first_reg_str).strip()
-            if "/" in first_reg_str:
-                # Format: MM/YYYY or YYYY/MM
-                parts = first_reg_str.split("/")
-                if len(parts) == 2:
-                    if len(parts[0]) == 4:  # YYYY/MM
-                        year = int(parts[0])
-                        month = int(parts[1])
-                    else:  # MM/YYYY
-                        month = int(parts[0])
-                        year = int(parts[1])
-                    first_reg = datetime(year, month, 1)
-            elif "-" in first_reg_str:
-                # Format: YYYY-MM or YYYY-MM-DD
-                parts = first_reg_str.split("-")
-                if len(parts) >= 2:
-                    first_reg = datetime(int(parts[0]), int(parts[1]), 1)
-                    year = int(parts[0])
-            elif first_reg_str.isdigit() and len(first_reg_str) == 4:
-                # Format: YYYY
-                year = int(first_reg_str)
-                first_reg = datetime(year, 1, 1)
-        except:
-            pass
+        # Format: MM/YYYY, YYYY/MM, YYYY-MM(-DD) or YYYY
+        reg_year, reg_month = _parse_reg_date(str(first_reg_str))
+        if reg_year is not None:
+            year = reg_year
+            first_reg = _month_start(reg_year, reg_month) or first_reg
 
     # Override year if explicitly provided
-    year_field = get_field(["year", "Year", "productionYear"])
-    if year_field:
-        try:
-            year = int(str(year_field).strip())
-        except:
-            pass
+    year_field = _parse_int(str(get_field(("year", "Year", "productionYear")) or ""))
+    if year_field is not None:
+        year = year_field
 
-    # Get mileage - try multiple field names
+    return first_reg, year
+
+
+def _parse_as24_mileage(get_field: Callable[[tuple], Any]) -> int:
+    """Mileage in km from a number, {"raw": ...} or a formatted string."""
     # IMPORTANT: handle numeric types (float like 12499.0) before string conversion
-    mileage_val = get_field([
+    mileage_val = get_field((
         "mileage", "km", "mileageInKm", "Mileage", "Km",
         "kilometerstand", "kilometers"
-    ]) or 0
+    )) or 0
     if isinstance(mileage_val, dict):
         mileage_val = mileage_val.get("raw", 0)
     if isinstance(mileage_val, (int, float)):
-        mileage = int(mileage_val)
-    else:
-        mileage_str = str(mileage_val)
-        # Try float conversion first (handles "12499.0" correctly)
-        try:
-            mileage = int(float(mileage_str))
-        except (ValueError, TypeError):
-            mileage = int("".join(filter(str.isdigit, mileage_str)) or 0)
+        return int(mileage_val)
+    mileage_str = str(mileage_val)
+    # Try float conversion first (handles "12499.0" correctly)
+    try:
+        return int(float(mileage_str))
+    except (ValueError, TypeError):
+        return int(_digits(mileage_str) or 0)
 
+
+def _parse_as24_price(item: dict, get_field: Callable[[tuple], Any]) -> int:
+    """Asking price in whole euros, or 0 when missing or implausible."""
     # Get price - handle nested structure from 3x1t scraper: price.total.amount
     price = 0
     price_obj = item.get("price")
     if isinstance(price_obj, dict):
         # Nested structure: price.total.amount
-        total_obj = price_obj.get("total", {})
-        if isinstance(total_obj, dict):
-            price = total_obj.get("amount", 0)
-            if price:
-                price = int(price)
+        price = _as_dict(price_obj.get("total")).get("amount", 0)
+        if price:
+            price = int(price)
         # Also try price.value or price.amount directly
         if not price:
             price = price_obj.get("amount", price_obj.get("value", 0))
             if price:
                 price = int(price)
     elif price_obj:
-        # Direct price value
-        price_str = str(price_obj)
-        # Handle prices like "23.600" (European format) or "23600" or "€ 23.600"
-        price_str = price_str.replace("€", "").replace(" ", "").strip()
-        # Handle European decimal separator (. as thousands, , as decimal)
-        if "." in price_str and "," not in price_str:
-            parts = price_str.split(".")
-            if len(parts) == 2 and len(parts[1]) == 3:
-                price_str = price_str.replace(".", "")
-        price_str = price_str.split(",")[0]
-        price = int("".join(filter(str.isdigit, price_str)) or 0)
+        # Direct price value like "23.600", "23600" or "€ 23.600"
+        price = _parse_apify_price(price_obj)
 
     # Fallback to other field names
     if not price:
-        price_val = get_field([
+        price_val = get_field((
             "priceInEur", "priceNumeric", "Price", "priceEur", "askingPrice"
-        ]) or "0"
-        price_str = str(price_val)
-        price_str = price_str.replace("€", "").replace(" ", "").strip()
-        if "." in price_str and "," not in price_str:
-            parts = price_str.split(".")
-            if len(parts) == 2 and len(parts[1]) == 3:
-                price_str = price_str.replace(".", "")
-        price_str = price_str.split(",")[0]
-        price = int("".join(filter(str.isdigit, price_str)) or 0)
-
+        )) or "0"
+        price = _parse_apify_price(price_val)
 
     # Sanity check - price should be reasonable
     if price < 100 or price > 500000:
         price = 0
 
-    # Get fuel type
-    fuel_raw = get_field([
-        "fuelType", "fuel", "Fuel", "FuelType", "Kraftstoff"
-    ]) or "petrol"
-    fuel_type = normalize_fuel_type(str(fuel_raw))
-    print(f"[AUTOSCOUT24.DE APIFY] Fuel raw: {fuel_raw} → normalized: {fuel_type}")
+    return price
 
-    # PHEV detection: also check model name for known PHEV indicators
-    is_phev = False
-    if fuel_type == "hybrid":
-        is_phev = True
-    elif is_phev_model_name(model, make):
-        print(f"[AUTOSCOUT24.DE APIFY] Detected PHEV from model name: {model}, overriding fuel to 'hybrid'")
-        fuel_type = "hybrid"
-        is_phev = True
-
-    # Get transmission
-    trans_raw = get_field([
-        "transmission", "gearbox", "Transmission", "Gearbox", "Getriebe"
-    ]) or "automatic"
-    transmission = normalize_transmission(str(trans_raw))
 
+def _parse_as24_co2(
+    get_field: Callable[[tuple], Any],
+    attrs: dict,
+    fuel_type: str,
+    is_phev: bool,
+) -> tuple[int, str]:
+    """CO2 in g/km (PHEV-weighted where needed) and an optional note explaining an estimate."""
     # Get CO2 - try multiple field names (including special characters)
-    co2_val = get_field([
+    co2_val = get_field((
         "co2Emission", "co2", "emissionsCO2", "CO2", "Co2",
         "co2_gkm", "emissionCO2", "CO₂ emissions"
-    ])
+    ))
     # Also check attrs directly for special character keys
     if not co2_val and attrs:
         for key in attrs.keys():
@@ -1350,13 +1444,12 @@ def _parse_autoscout24_apify(item: dict, url: str) -> VehicleData:
     co2 = 0
     co2_note = ""
     co2_found = False
-    default_co2 = {"petrol": 150, "diesel": 130, "electric": 0, "hybrid": 50, "lpg": 140}.get(fuel_type, 150)
 
     if co2_val:
         co2_str = str(co2_val)
         if co2_str and co2_str != "None":
             # Extract just the number from strings like "231 g/km (comb.)"
-            digits = "".join(filter(str.isdigit, co2_str.split()[0] if co2_str.split() else co2_str))
+            digits = _digits(co2_str.split()[0] if co2_str.split() else co2_str)
             if digits:
                 parsed_co2 = int(digits)
                 if 0 <= parsed_co2 <= 400:
@@ -1370,26 +1463,84 @@ def _parse_autoscout24_apify(item: dict, url: str) -> VehicleData:
         co2_note = (f"PHEV gewogen CO2 geschat op {co2} g/km (WLTP utility factor, "
                     f"ICE-only {co2_depleted} g/km). "
                     f"Controleer de officiële gewogen CO2 voor exacte BPM.")
-        print(f"[AUTOSCOUT24.DE APIFY] PHEV: CO2 {co2_depleted} → weighted estimate {co2} g/km")
+        logger.debug("[AUTOSCOUT24.DE APIFY] PHEV: CO2 %s → weighted estimate %s g/km", co2_depleted, co2)
 
     # Estimate CO2 from power if not available
     if not co2_found:
-        co2 = default_co2
-        power_val = get_field(["power", "kw", "powerKw", "Power", "Kw"])
+        co2 = _DEFAULT_CO2.get(fuel_type, 150)
+        power_val = get_field(("power", "kw", "powerKw", "Power", "Kw"))
         if power_val:
             kw_str = str(power_val)
-            kw_digits = "".join(filter(str.isdigit, kw_str.split("kW")[0]))
+            kw_digits = _digits(kw_str.split("kW")[0])
             if kw_digits:
-                kw = int(kw_digits)
-                if fuel_type == "diesel":
-                    co2 = min(250, max(100, int(kw * 1.0)))
-                elif fuel_type == "electric":
-                    co2 = 0
-                elif fuel_type == "hybrid":
-                    co2 = 45
+                co2 = _estimate_co2_from_kw(int(kw_digits), fuel_type)
+                if fuel_type == "hybrid":
                     co2_note = "PHEV CO2 geschat op 45 g/km (geen exacte data beschikbaar). Controleer de officiële gewogen CO2 voor exacte BPM."
-                else:
-                    co2 = min(300, max(100, int(kw * 1.3)))
+
+    return co2, co2_note
+
+
+def _parse_autoscout24_apify(item: dict, url: str) -> VehicleData:
+    """Parse AutoScout24 Apify format (flat structure)."""
+    # The 3x1t~autoscout24-scraper-ppr returns data with:
+    # - brand, model at top level
+    # - attributes dict with keys like "First Registration", "Mileage", "Fuel"
+    # - price as nested object: price.total.amount
+    attrs = item.get("attributes", {})
+    if isinstance(attrs, str):
+        attrs = {}
+
+    # Case-insensitive indexes of the non-empty values, built once per item.
+    # Reversed so the first key in insertion order wins, like a linear scan.
+    item_lower = {k.lower(): v for k, v in reversed(item.items()) if v}
+    attrs_lower = {k.lower(): v for k, v in reversed(attrs.items()) if v} if isinstance(attrs, dict) else {}
+
+    # Helper function to get value from item or attrs with flexible key matching
+    def get_field(keys):
+        """Try multiple key variations to find a value."""
+        for key in keys:
+            # Try item first
+            if key in item and item[key]:
+                return item[key]
+            # Try attrs
+            if key in attrs and attrs[key]:
+                return attrs[key]
+            # Try lowercase/case-insensitive
+            key_lower = key.lower()
+            value = item_lower.get(key_lower) or attrs_lower.get(key_lower)
+            if value:
+                return value
+        return None
+
+    title = get_field(("title", "name", "Title", "Name")) or ""
+    make, model = _parse_as24_make_model(get_field, title)
+    first_reg, year = _parse_as24_registration(get_field)
+    mileage = _parse_as24_mileage(get_field)
+    price = _parse_as24_price(item, get_field)
+
+    # Get fuel type
+    fuel_raw = get_field((
+        "fuelType", "fuel", "Fuel", "FuelType", "Kraftstoff"
+    )) or "petrol"
+    fuel_type = normalize_fuel_type(str(fuel_raw))
+    logger.debug("[AUTOSCOUT24.DE APIFY] Fuel raw: %s → normalized: %s", fuel_raw, fuel_type)
+
+    # PHEV detection: also check model name for known PHEV indicators
+    is_phev = False
+    if fuel_type == "hybrid":
+        is_phev = True
+    elif is_phev_model_name(model, make):
+        logger.debug("[AUTOSCOUT24.DE APIFY] Detected PHEV from model name: %s, overriding fuel to 'hybrid'", model)
+        fuel_type = "hybrid"
+        is_phev = True
+
+    # Get transmission
+    trans_raw = get_field((
+        "transmission", "gearbox", "Transmission", "Gearbox", "Getriebe"
+    )) or "automatic"
+    transmission = normalize_transmission(str(trans_raw))
+
+    co2, co2_note = _parse_as24_co2(get_field, attrs, fuel_type, is_phev)
 
     if not title:
         title = f"{make} {model}"
@@ -1477,15 +1628,11 @@ async def scrape_mobile_de_apify(url: str, apify_token: str) -> ScrapeResult:
             error_details=str(e),
         )
     except Exception as e:
-        import traceback
-        error_trace = traceback.format_exc()
-        print(f"[MOBILE.DE APIFY] Exception: {e}")
-        print(f"[MOBILE.DE APIFY] Traceback: {error_trace}")
         return ScrapeResult(
             success=False,
             error_type="SCRAPER_ERROR",
             error_message="Apify scraping failed.",
-            error_details=f"{str(e)} | {error_trace[:500]}",
+            error_details=_exception_details("MOBILE.DE APIFY", e),
         )
 
 
@@ -1545,19 +1692,99 @@ async def scrape_autoscout24_de_apify(url: str, apify_token: str) -> ScrapeResul
             error_details=str(e),
         )
     except Exception as e:
-        import traceback
-        error_trace = traceback.format_exc()
-        print(f"[AUTOSCOUT24.DE APIFY] Exception: {e}")
-        print(f"[AUTOSCOUT24.DE APIFY] Traceback: {error_trace}")
         return ScrapeResult(
             success=False,
             error_type="SCRAPER_ERROR",
             error_message="Apify scraping failed.",
-            error_details=f"{str(e)} | {error_trace[:500]}",
+            error_details=_exception_details("AUTOSCOUT24.DE APIFY", e),
         )
 
 
+async def _race_direct_and_apify(direct, apify) -> ScrapeResult:
+    """
+    Run a direct scrape and its Apify fallback concurrently.
+
+    The direct result still takes precedence: a success or LISTING_OFFLINE
+    returns immediately and cancels the Apify task, any other failure returns
+    the Apify result, which has been running in the meantime.
+
+    Args:
+        direct: Direct scraper coroutine
+        apify: Apify scraper coroutine
+
+    Returns:
+        ScrapeResult from the direct scraper or the Apify fallback
+    """
+    direct_task = asyncio.create_task(direct)
+    apify_task = asyncio.create_task(apify)
+    try:
+        result = await direct_task
+
+        if result.success:
+            print("[SCRAPER] Direct scraping SUCCESS")
+            return result
+
+        # If listing is offline, don't fallback (it's truly gone)
+        if result.error_type == "LISTING_OFFLINE":
+            print("[SCRAPER] Listing offline, no fallback")
+            return result
+
+        print(f"[SCRAPER] Direct scraping failed ({result.error_type}), waiting for Apify fallback...")
+        return await apify_task
+    finally:
+        for task in (direct_task, apify_task):
+            if not task.done():
+                task.cancel()
+
+
+def _finish_scrape(url: str, task: asyncio.Task) -> None:
+    """Done-callback for an in-flight scrape: release the URL and cache successes."""
+    _SCRAPE_INFLIGHT.pop(url, None)
+    if task.cancelled() or task.exception() is not None:
+        return
+    result = task.result()
+    if not result.success:
+        return
+
+    now = time.monotonic()
+    expired = [key for key, (stored_at, _) in _SCRAPE_CACHE.items() if now - stored_at >= _SCRAPE_CACHE_TTL]
+    for key in expired:
+        del _SCRAPE_CACHE[key]
+    _SCRAPE_CACHE[url] = (now, result)
+
+
 async def scrape_vehicle(url: str, apify_token: str) -> ScrapeResult:
+    """
+    Scrape a vehicle listing, reusing a recent or in-flight scrape of the same URL.
+
+    Successful results are cached for _SCRAPE_CACHE_TTL seconds; concurrent
+    calls for a URL await the same scrape instead of starting their own.
+
+    Args:
+        url: URL of the listing
+        apify_token: Apify API token
+
+    Returns:
+        ScrapeResult with vehicle data or error
+    """
+    cached = _SCRAPE_CACHE.get(url)
+    if cached and time.monotonic() - cached[0] < _SCRAPE_CACHE_TTL:
+        print("[SCRAPER] Returning cached result")
+        return cached[1]
+
+    task = _SCRAPE_INFLIGHT.get(url)
+    if task is None:
+        task = asyncio.create_task(_scrape_vehicle_uncached(url, apify_token))
+        _SCRAPE_INFLIGHT[url] = task
+        task.add_done_callback(functools.partial(_finish_scrape, url))
+    else:
+        print("[SCRAPER] Joining in-flight scrape for the same URL")
+
+    # Shielded so one caller giving up doesn't cancel the scrape for the others
+    return await asyncio.shield(task)
+
+
+async def _scrape_vehicle_uncached(url: str, apify_token: str) -> ScrapeResult:
     """
     Scrape a vehicle listing with direct HTTP (primary) and Apify fallback.
 
@@ -1565,6 +1792,7 @@ async def scrape_vehicle(url: str, apify_token: str) -> ScrapeResult:
     1. Try direct HTTP scraping first (fast, free)
     2. If direct fails (except LISTING_OFFLINE), fall back to Apify
     3. LISTING_OFFLINE errors don't trigger fallback (listing truly offline)
+    4. With RACE_FALLBACK, Apify runs alongside direct scraping (same precedence)
 
     Args:
         url: URL of the listing
@@ -1591,10 +1819,17 @@ async def scrape_vehicle(url: str, apify_token: str) -> ScrapeResult:
             error_message="Could not extract listing ID from URL.",
         )
 
-    # Import USE_DIRECT_SCRAPING flag
-    from constants import USE_DIRECT_SCRAPING
+    # Import scraping strategy flags
+    from constants import USE_DIRECT_SCRAPING, RACE_FALLBACK
 
     if source == "mobile.de":
+        if USE_DIRECT_SCRAPING and RACE_FALLBACK:
+            print("[SCRAPER] Racing mobile.de direct HTTP scraping against Apify...")
+            return await _race_direct_and_apify(
+                scrape_mobile_de_direct(url),
+                scrape_mobile_de_apify(url, apify_token),
+            )
+
         # Try direct scraping first (if enabled)
         if USE_DIRECT_SCRAPING:
             print("[SCRAPER] Trying mobile.de direct HTTP scraping...")
@@ -1620,6 +1855,13 @@ async def scrape_vehicle(url: str, apify_token: str) -> ScrapeResult:
         return result
 
     elif source == "autoscout24":
+        if USE_DIRECT_SCRAPING and RACE_FALLBACK:
+            print("[SCRAPER] Racing AutoScout24.de direct HTTP scraping against Apify...")
+            return await _race_direct_and_apify(
+                scrape_autoscout24_de_direct(url),
+                scrape_autoscout24_de_apify(url, apify_token),
+            )
+
         # Try direct scraping first (if enabled)
         if USE_DIRECT_SCRAPING:
             print("[SCRAPER] Trying AutoScout24.de direct HTTP scraping...")
@@ -1654,23 +1896,8 @@ async def scrape_vehicle(url: str, apify_token: str) -> ScrapeResult:
 
 def vehicle_to_dict(vehicle: VehicleData) -> dict:
     """Convert VehicleData to dictionary for JSON serialization."""
-    result = {
-        "make": vehicle.make,
-        "model": vehicle.model,
-        "year": vehicle.year,
-        "mileage_km": vehicle.mileage_km,
-        "price_eur": vehicle.price_eur,
-        "fuelType": vehicle.fuel_type,
-        "transmission": vehicle.transmission,
-        "co2_gkm": vehicle.co2_gkm,
-        "firstRegistrationDate": vehicle.first_registration_date.isoformat(),
-        "listingUrl": vehicle.listing_url,
-        "source": vehicle.source,
-        "title": vehicle.title,
-        "features": vehicle.features,
-        "attributes": vehicle.attributes,
-        "isPhev": vehicle.is_phev,
-    }
+    result = dict(zip(_VEHICLE_DICT_KEYS, _get_vehicle_fields(vehicle)))
+    result["firstRegistrationDate"] = vehicle.first_registration_date.isoformat()
     # Include CO2 note for PHEVs (explains weighted CO2 estimation)
     if vehicle.co2_note:
         result["co2Note"] = vehicle.co2_note
@@ -1,6 +1,7 @@
 """
 User-Agent rotation for anti-scraping bypass.
 """
+import itertools
 import random
 
 USER_AGENTS = [
@@ -54,3 +55,12 @@ def get_random_headers() -> dict:
         "Sec-Fetch-User": "?1",
         "Cache-Control": "max-age=0",
     }
+
+
+# Pre-built header sets, rotated round-robin by get_rotating_headers()
+_HEADER_RING = itertools.cycle([get_random_headers() for _ in range(16)])
+
+
+def get_rotating_headers() -> dict:
+    """Get the next pre-built browser header set (a copy, safe to modify)."""
+    return next(_HEADER_RING).copy()
@@ -2,12 +2,127 @@
 Utility functions for the Driving Passion Auto Import Calculator.
 """
 
+import functools
 import math
 import re
 from datetime import datetime
 from typing import Optional
 
 
+def _build_keyword_scanner(keywords: dict[str, tuple[str, ...]]) -> tuple[re.Pattern, dict[str, frozenset]]:
+    """
+    Compile tagged keywords into a single-pass substring scanner.
+
+    The pattern is a zero-width lookahead over all keywords (longest first),
+    so one finditer reports the longest keyword starting at every position.
+    Each keyword's payload holds the tags of every keyword it contains, which
+    makes the union of payloads equal to the tags of all keywords occurring
+    anywhere in the text - the same answer as an Aho-Corasick automaton.
+
+    Args:
+        keywords: Mapping of tag -> keywords that set it
+
+    Returns:
+        Tuple of (compiled pattern, keyword -> tags payload)
+    """
+    word_tags: dict[str, set] = {}
+    for tag, words in keywords.items():
+        for word in words:
+            word_tags.setdefault(word, set()).add(tag)
+
+    payload = {
+        word: frozenset(tag for other, tags in word_tags.items() if other in word for tag in tags)
+        for word in word_tags
+    }
+    alternation = "|".join(map(re.escape, sorted(word_tags, key=len, reverse=True)))
+    return re.compile(f"(?=({alternation}))"), payload
+
+
+def _scan_keywords(scanner: tuple[re.Pattern, dict[str, frozenset]], text: str) -> set:
+    """Return the tags of all scanner keywords occurring in text."""
+    pattern, payload = scanner
+    tags = set()
+    for m in pattern.finditer(text):
+        tags |= payload[m.group(1)]
+    return tags
+
+
+_FUEL_SCANNER = _build_keyword_scanner({
+    'hybrid': ('hybrid', 'hybride', 'plug-in', 'phev', 'plugin',
+               'plugin_hybrid', 'mild_hybrid', 'plug_in',
+               'elektro/benzin', 'benzin/elektro',
+               'elektro/diesel', 'diesel/elektro',
+               'electric/petrol', 'petrol/electric',
+               'electric/diesel', 'diesel/electric',
+               'benzine/elektro', 'elektro/benzine',
+               'gasoline/electric', 'electric/gasoline'),
+    'has_electric': ('elektro', 'electric', 'elektrisch', 'electro'),
+    'has_combustion': ('benzin', 'diesel', 'petrol', 'gasoline', 'benzine'),
+    'electric': ('electric', 'elektrisch', 'elektro', 'ev', 'battery electric', 'bev', 'electro'),
+    'diesel': ('diesel', 'diesel (diesel)'),
+    'petrol': ('petrol', 'benzine', 'benzin', 'gasoline', 'petrol (gasoline)'),
+    'lpg': ('lpg', 'gas', 'autogas'),
+})
+_FUEL_PRIORITY = ('electric', 'diesel', 'petrol', 'lpg')
+
+# PHEV model-name indicators, one pattern per make. Brand-specific
+# indicators also apply when the make is unknown.
+_PHEV_GENERIC = (
+    r"phev|plug-?in"          # Generic (also Mitsubishi Outlander PHEV)
+    r"|tfsi ?e"               # Audi: "TFSI e"
+    r"|gte|e-?hybrid"         # VW: GTE, eHybrid; Porsche: E-Hybrid
+    r"|eq[ -]power"           # Mercedes: EQ Power
+)
+_PHEV_BMW = r"\d+e\b"       # BMW: 330e, X3 30e, 745e
+_PHEV_VOLVO = r"recharge"   # Volvo: Recharge (T6/T8)
+
+_PHEV_GENERIC_RE = re.compile(_PHEV_GENERIC)
+_PHEV_CHECKS = {
+    'bmw': re.compile(f"{_PHEV_GENERIC}|{_PHEV_BMW}"),
+    'volvo': re.compile(f"{_PHEV_GENERIC}|{_PHEV_VOLVO}"),
+    '': re.compile(f"{_PHEV_GENERIC}|{_PHEV_BMW}|{_PHEV_VOLVO}"),
+}
+
+_TRANSMISSION_SCANNER = _build_keyword_scanner({
+    'automatic': ('automatic', 'automatik', 'automaat', 'auto', 'dsg', 'tiptronic', 's tronic'),
+    'manual': ('manual', 'manuell', 'handgeschakeld', 'schaltgetriebe'),
+})
+
+# RS model corrections for Audi, matched on the lowercased model without spaces
+_RS_MODELS = {
+    'rsq3': 'RS Q3',
+    'rsq5': 'RS Q5',
+    'rsq7': 'RS Q7',
+    'rsq8': 'RS Q8',
+    'rs3': 'RS3',
+    'rs4': 'RS4',
+    'rs5': 'RS5',
+    'rs6': 'RS6',
+    'rs7': 'RS7',
+}
+_RS_RE = re.compile("|".join(_RS_MODELS))
+
+# Identify engine-related model parts (should stay in base_model)
+# vs trim/equipment parts (can be separated as variant)
+_ENGINE_PART_RE = re.compile(
+    r"\d"  # Engine size or type like "2.0", "320d", "118i"
+    r"|tdi|tsi|tfsi|fsi|gti|gtd|rs|amg|xdrive|4matic|quattro|e-tron|phev|hybrid"
+)
+_TRIM_LEVELS = frozenset({'highline', 'comfortline', 'trendline', 'style', 'sport',
+                          'business', 'executive', 'luxury', 'premium', 'edition',
+                          'line', 'pack', 'plus', 'comfort', 'elegance', 'dynamic'})
+
+# WLTP utility factors (see estimate_phev_weighted_co2) for whole-km electric
+# ranges up to 200 km, which covers every PHEV on the market
+_UF_TABLE = tuple(1 - math.exp(-0.0299 * r) for r in range(201))
+
+# "Does this string contain a digit?" as one C-level scan
+has_digit = re.compile(r"\d").search
+
+# Dutch thousands separator for format_currency
+_COMMA_TO_DOT = str.maketrans(",", ".")
+
+
 def calculate_vehicle_age_months(first_registration_date: datetime) -> int:
     """
     Calculate the age of a vehicle in months.
@@ -29,6 +144,7 @@ def calculate_vehicle_age_months(first_registration_date: datetime) -> int:
     return max(0, months)
 
 
+@functools.lru_cache(maxsize=2048)
 def normalize_fuel_type(fuel_type: str) -> str:
     """
     Normalize fuel type strings to standard values.
@@ -42,55 +158,23 @@ def normalize_fuel_type(fuel_type: str) -> str:
     Returns:
         Normalized fuel type: 'petrol', 'diesel', 'electric', 'hybrid', 'lpg'
     """
-    fuel_lower = fuel_type.lower().strip()
-
-    # 1. Check hybrid/PHEV FIRST - these often contain petrol/diesel words
-    # e.g., "Elektro/Benzine", "Benzin/Elektro", "Hybrid (Petrol/Electric)"
-    hybrid_terms = ['hybrid', 'hybride', 'plug-in', 'phev', 'plugin',
-                    'plugin_hybrid', 'mild_hybrid', 'plug_in']
-    hybrid_combos = [
-        'elektro/benzin', 'benzin/elektro',
-        'elektro/diesel', 'diesel/elektro',
-        'electric/petrol', 'petrol/electric',
-        'electric/diesel', 'diesel/electric',
-        'benzine/elektro', 'elektro/benzine',
-        'gasoline/electric', 'electric/gasoline',
-    ]
-
-    if any(term in fuel_lower for term in hybrid_terms):
-        return 'hybrid'
-    if any(combo in fuel_lower for combo in hybrid_combos):
-        return 'hybrid'
+    tags = _scan_keywords(_FUEL_SCANNER, fuel_type.lower())
 
-    # Also detect hybrid if both electric AND combustion terms appear
-    has_electric = any(t in fuel_lower for t in ['elektro', 'electric', 'elektrisch', 'electro'])
-    has_combustion = any(t in fuel_lower for t in ['benzin', 'diesel', 'petrol', 'gasoline', 'benzine'])
-    if has_electric and has_combustion:
+    # 1. Hybrid/PHEV FIRST - these often contain petrol/diesel words
+    # e.g., "Elektro/Benzine", "Benzin/Elektro", "Hybrid (Petrol/Electric)".
+    # Also hybrid if both electric AND combustion terms appear.
+    if 'hybrid' in tags or ('has_electric' in tags and 'has_combustion' in tags):
         return 'hybrid'
 
-    # 2. Check electric (pure EV) - must come after hybrid check
-    electric_terms = ['electric', 'elektrisch', 'elektro', 'ev', 'battery electric', 'bev', 'electro']
-    if any(term in fuel_lower for term in electric_terms):
-        return 'electric'
-
-    # 3. Check diesel
-    diesel_terms = ['diesel', 'diesel (diesel)']
-    if any(term in fuel_lower for term in diesel_terms):
-        return 'diesel'
-
-    # 4. Check petrol
-    petrol_terms = ['petrol', 'benzine', 'benzin', 'gasoline', 'petrol (gasoline)']
-    if any(term in fuel_lower for term in petrol_terms):
-        return 'petrol'
-
-    # 5. Check LPG
-    lpg_terms = ['lpg', 'gas', 'autogas']
-    if any(term in fuel_lower for term in lpg_terms):
-        return 'lpg'
+    # 2. Then electric (pure EV), diesel, petrol, LPG - in that order
+    for fuel in _FUEL_PRIORITY:
+        if fuel in tags:
+            return fuel
 
     return 'petrol'  # Default to petrol if unknown
 
 
+@functools.lru_cache(maxsize=2048)
 def is_phev_model_name(model: str, make: str = "") -> bool:
     """
     Detect if a model name indicates a plug-in hybrid (PHEV).
@@ -104,44 +188,8 @@ def is_phev_model_name(model: str, make: str = "") -> bool:
     - Porsche: "E-Hybrid"
     - Generic: "PHEV", "Plug-in", "plug-in hybrid"
     """
-    model_lower = model.lower()
-    make_lower = make.lower()
-
-    # Generic PHEV indicators
-    if any(term in model_lower for term in ['phev', 'plug-in', 'plugin']):
-        return True
-
-    # Audi: "TFSI e" (with space before 'e')
-    if 'tfsi e' in model_lower or 'tfsie' in model_lower:
-        return True
-
-    # BMW: models ending in 'e' after a number (e.g., "330e", "X3 30e", "745e")
-    if make_lower in ('bmw', ''):
-        if re.search(r'\d+e\b', model_lower):
-            return True
-
-    # VW: GTE, eHybrid
-    if any(term in model_lower for term in ['gte', 'ehybrid', 'e-hybrid']):
-        return True
-
-    # Mercedes: EQ Power
-    if 'eq power' in model_lower or 'eq-power' in model_lower:
-        return True
-
-    # Volvo: Recharge (T6/T8)
-    if make_lower in ('volvo', '') and 'recharge' in model_lower:
-        return True
-
-    # Porsche: E-Hybrid
-    if 'e-hybrid' in model_lower:
-        return True
-
-    # Mitsubishi: Outlander PHEV
-    if 'outlander' in model_lower and make_lower in ('mitsubishi', ''):
-        if 'phev' in model_lower:
-            return True
-
-    return False
+    pattern = _PHEV_CHECKS.get(make.lower(), _PHEV_GENERIC_RE)
+    return pattern.search(model.lower()) is not None
 
 
 def estimate_phev_weighted_co2(co2_depleted: int, electric_range_km: int = 50) -> int:
@@ -162,11 +210,15 @@ def estimate_phev_weighted_co2(co2_depleted: int, electric_range_km: int = 50) -
     Returns:
         Estimated weighted CO2 in g/km
     """
-    uf = 1 - math.exp(-0.0299 * electric_range_km)
+    if isinstance(electric_range_km, int) and 0 <= electric_range_km < len(_UF_TABLE):
+        uf = _UF_TABLE[electric_range_km]
+    else:
+        uf = 1 - math.exp(-0.0299 * electric_range_km)
     weighted = (1 - uf) * co2_depleted
     return max(1, round(weighted))
 
 
+@functools.lru_cache(maxsize=2048)
 def normalize_transmission(transmission: str) -> str:
     """
     Normalize transmission strings to standard values.
@@ -177,14 +229,11 @@ def normalize_transmission(transmission: str) -> str:
     Returns:
         Normalized transmission: 'automatic' or 'manual'
     """
-    trans_lower = transmission.lower().strip()
+    tags = _scan_keywords(_TRANSMISSION_SCANNER, transmission.lower())
 
-    auto_terms = ['automatic', 'automatik', 'automaat', 'auto', 'dsg', 'tiptronic', 's tronic']
-    manual_terms = ['manual', 'manuell', 'handgeschakeld', 'schaltgetriebe']
-
-    if any(term in trans_lower for term in auto_terms):
+    if 'automatic' in tags:
         return 'automatic'
-    if any(term in trans_lower for term in manual_terms):
+    if 'manual' in tags:
         return 'manual'
 
     return 'automatic'  # Default to automatic if unknown
@@ -202,10 +251,11 @@ def format_currency(amount: float, currency: str = "EUR") -> str:
         Formatted currency string
     """
     if currency == "EUR":
-        return f"€{amount:,.0f}".replace(",", ".")
+        return f"€{amount:,.0f}".translate(_COMMA_TO_DOT)
     return f"{amount:,.0f} {currency}"
 
 
+@functools.lru_cache(maxsize=2048)
 def extract_model_variant(model: str) -> tuple[str, Optional[str]]:
     """
     Extract base model and variant from model string.
@@ -223,58 +273,21 @@ def extract_model_variant(model: str) -> tuple[str, Optional[str]]:
     Returns:
         Tuple of (base_model, variant)
     """
-    # RS model corrections for Audi
-    rs_models = {
-        'rsq3': 'RS Q3',
-        'rsq5': 'RS Q5',
-        'rsq7': 'RS Q7',
-        'rsq8': 'RS Q8',
-        'rs3': 'RS3',
-        'rs4': 'RS4',
-        'rs5': 'RS5',
-        'rs6': 'RS6',
-        'rs7': 'RS7',
-    }
-
-    model_lower = model.lower().replace(" ", "")
-
-    for key, corrected in rs_models.items():
-        if key in model_lower:
-            return corrected, None
+    rs_match = _RS_RE.search(model.lower().replace(" ", ""))
+    if rs_match:
+        return _RS_MODELS[rs_match.group()], None
 
     # Split model into parts
     parts = model.split()
     if len(parts) <= 1:
         return model, None
 
-    # Identify engine-related parts (should stay in base_model)
-    # vs trim/equipment parts (can be separated as variant)
-    engine_indicators = ['tdi', 'tsi', 'tfsi', 'fsi', 'gti', 'gtd', 'rs', 'amg',
-                        'xdrive', '4matic', 'quattro', 'e-tron', 'phev', 'hybrid',
-                        'd', 'i', 'e', 's', 'm']  # Common suffixes like "320d", "118i"
-    trim_levels = ['highline', 'comfortline', 'trendline', 'style', 'sport',
-                   'business', 'executive', 'luxury', 'premium', 'edition',
-                   'line', 'pack', 'plus', 'comfort', 'elegance', 'dynamic']
-
-    # Find where trim level starts (if any)
+    # Find where trim level starts (if any): a trim level word, or past the
+    # first few words any part that isn't engine-related
     trim_start_idx = None
     for i, part in enumerate(parts):
         part_lower = part.lower()
-        # Check if this is a trim level word
-        if part_lower in trim_levels:
-            trim_start_idx = i
-            break
-        # If we see engine indicators, keep going
-        is_engine_part = False
-        for indicator in engine_indicators:
-            if indicator in part_lower or part_lower.endswith(indicator):
-                is_engine_part = True
-                break
-        # If it's a number (engine size like "2.0" or "320"), keep it
-        if any(c.isdigit() for c in part):
-            is_engine_part = True
-        # If not an engine part and not the first few words, might be trim
-        if not is_engine_part and i > 2:
+        if part_lower in _TRIM_LEVELS or (i > 2 and not _ENGINE_PART_RE.search(part_lower)):
             trim_start_idx = i
             break
 
@@ -3,15 +3,36 @@ AI-powered vehicle valuation using OpenRouter.
 """
 
 import httpx
-from dataclasses import dataclass
+import asyncio
+import random
+import re
+from dataclasses import dataclass, field
 from typing import Optional
-import json
+import orjson
 
 from constants import DEFAULT_AI_MODEL
 from scrapers import VehicleData
 from dutch_market import DutchComparable
 
 
+# Shared OpenRouter client; keep-alive connections skip the TCP + TLS
+# handshake on every valuation
+_CLIENT = httpx.AsyncClient(
+    http2=True,
+    timeout=45,
+    limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60),
+)
+
+# Cap concurrent OpenRouter calls per container, and retry rate limits and
+# transient upstream errors with jittered exponential backoff
+_SEMAPHORE = asyncio.Semaphore(8)
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_ATTEMPTS = 3
+
+# Markdown code fence (optionally ```json) around the model's JSON answer
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*(?:```|\Z)", re.S)
+
+
 @dataclass
 class PriceBreakdown:
     """Breakdown of how the price was determined."""
@@ -28,23 +49,17 @@ class PriceBreakdown:
                 self.market_adjustment)
 
 
-@dataclass
+@dataclass(slots=True)
 class Valuation:
     """AI valuation result."""
     estimated_retail_price: int
     estimated_quick_sale_price: int
     confidence: float
     reasoning: str = ""
-    pros: list = None
-    cons: list = None
+    pros: list = field(default_factory=list)
+    cons: list = field(default_factory=list)
     price_breakdown: PriceBreakdown = None
 
-    def __post_init__(self):
-        if self.pros is None:
-            self.pros = []
-        if self.cons is None:
-            self.cons = []
-
 
 def build_valuation_prompt(vehicle: VehicleData, comparables: list[DutchComparable]) -> str:
     """
@@ -58,15 +73,14 @@ def build_valuation_prompt(vehicle: VehicleData, comparables: list[DutchComparab
         Prompt string
     """
     # Format comparables
-    comp_text = ""
+    comp_lines = []
     for i, comp in enumerate(comparables[:10], 1):
-        comp_text += f"{i}. {comp.title} - €{comp.price_eur:,} - {comp.mileage_km:,} km"
+        line = f"{i}. {comp.title} - €{comp.price_eur:,} - {comp.mileage_km:,} km"
         if comp.location:
-            comp_text += f" - {comp.location}"
-        comp_text += "\n"
+            line += f" - {comp.location}"
+        comp_lines.append(line + "\n")
 
-    if not comp_text:
-        comp_text = "Geen vergelijkbare auto's gevonden op de Nederlandse markt.\n"
+    comp_text = "".join(comp_lines) or "Geen vergelijkbare auto's gevonden op de Nederlandse markt.\n"
 
     # Format features
     features_text = ""
@@ -158,44 +172,51 @@ async def call_openrouter(
     """
     model = model or DEFAULT_AI_MODEL
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            "https://openrouter.ai/api/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-                "HTTP-Referer": "https://driving-passion.nl",
-                "X-Title": "Driving Passion Auto Import Calculator",
-            },
-            json={
-                "model": model,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "Je bent een expert auto-taxateur. Antwoord altijd in valid JSON format."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "temperature": 0.3,
-                "max_tokens": 1000,
+    body = orjson.dumps({
+        "model": model,
+        "messages": [
+            {
+                "role": "system",
+                "content": "Je bent een expert auto-taxateur. Antwoord altijd in valid JSON format."
             },
-            timeout=45,
-        )
-        response.raise_for_status()
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ],
+        "temperature": 0.3,
+        "max_tokens": 1000,
+    })
+
+    for attempt in range(_MAX_ATTEMPTS):
+        async with _SEMAPHORE:
+            response = await _CLIENT.post(
+                "https://openrouter.ai/api/v1/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {api_key}",
+                    "Content-Type": "application/json",
+                    "HTTP-Referer": "https://driving-passion.nl",
+                    "X-Title": "Driving Passion Auto Import Calculator",
+                },
+                content=body,
+            )
+        if response.status_code not in _RETRY_STATUSES or attempt == _MAX_ATTEMPTS - 1:
+            break
+        print(f"[OPENROUTER] HTTP {response.status_code}, retrying (attempt {attempt + 2}/{_MAX_ATTEMPTS})")
+        await asyncio.sleep(0.5 * 2 ** attempt + random.random() * 0.25)
+
+    response.raise_for_status()
 
-        result = response.json()
-        content = result["choices"][0]["message"]["content"]
+    result = orjson.loads(response.content)
+    content = result["choices"][0]["message"]["content"]
 
-        # Extract JSON from response (handle markdown code blocks)
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
+    # Extract JSON from response (handle markdown code blocks); JSON parsers
+    # already skip the surrounding whitespace of an unfenced reply
+    fence = _FENCE_RE.search(content)
+    if fence:
+        content = fence.group(1)
 
-        return json.loads(content.strip())
+    return orjson.loads(content)
 
 
 async def valuate_vehicle(
@@ -239,8 +260,8 @@ async def valuate_vehicle(
             estimated_quick_sale_price=int(result.get("estimatedQuickSalePrice", 0)),
             confidence=float(result.get("confidence", 0.5)),
             reasoning=result.get("reasoning", ""),
-            pros=result.get("pros", []),
-            cons=result.get("cons", []),
+            pros=result.get("pros") or [],
+            cons=result.get("cons") or [],
             price_breakdown=price_breakdown,
         )
 
@@ -249,8 +270,7 @@ async def valuate_vehicle(
 
         # Fallback: use market average if available
         if comparables:
-            prices = [c.price_eur for c in comparables]
-            avg_price = sum(prices) // len(prices)
+            avg_price = sum(c.price_eur for c in comparables) // len(comparables)
             return Valuation(
                 estimated_retail_price=avg_price,
                 estimated_quick_sale_price=int(avg_price * 0.9),